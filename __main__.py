@@ -7,9 +7,9 @@ from __future__ import annotations
 import logging
 import sys
 from pathlib import Path
-import time
+from typing import TYPE_CHECKING
 
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import Qt, QTimer, QThreadPool
 from PySide6.QtWidgets import QApplication
 
 # ── ensure repo root is on PYTHONPATH --------------------------------------
@@ -22,10 +22,15 @@ from stride_studio.utils.logger import init as init_logger
 from stride_studio.utils.theme import dark_theme
 from stride_studio.gui.splash_screen import StrideStudioSplash
 from stride_studio.gui.mode_dialog import ModeDialog
-from stride_studio.gui.main_window import MainWindow
+from stride_studio.core.models import warm_up
+
+# MainWindow pulls in cv2 (and the core pipeline): imported once a mode is
+# picked, by which time warm_up has loaded cv2 in the background
+if TYPE_CHECKING:
+    from stride_studio.gui.main_window import MainWindow
 
 # ---------------------------------------------------------------------------
-SPLASH_MS = 2000  # how long the logo stays up (ms)
+SPLASH_MS = 1500  # how long the logo stays up (ms), over the mode dialog
 logger = init_logger(logging.INFO)  # global logger early
 
 
@@ -35,35 +40,43 @@ def main() -> None:
 
     splash = StrideStudioSplash(app)
     splash.show()
-    # Allow splash to be visible for a short time, process events
-    start_time = time.time()
-    while time.time() - start_time < 1.5:  # Show for 1.5 seconds
-        app.processEvents()
-        time.sleep(0.02)
-
-    # Explicitly hide splash BEFORE showing the modal dialog
-    splash.hide()
-    app.processEvents()
-    # Clean up splash resources immediately after hiding
-    splash.deleteLater()
-
-    # Determine mode now that splash is hidden
-    dialog = ModeDialog()
-    dialog.setWindowModality(Qt.ApplicationModal)  # Make it properly modal
-    dialog.setWindowFlag(Qt.WindowStaysOnTopHint)  # Keep it on top
-    pick = dialog.exec_choice()  # True = live, False = video, None = cancel
-
-    if pick is None:
-        logger.info("Mode selection cancelled, exiting.")
-        # No main window created, just exit
-        return
-
-    logger.info("Mode selected: %s", "Live" if pick else "Video")
-
-    # Create and show the main window *after* mode is chosen
-    main_win = MainWindow(live=pick)
-    main_win.show()
 
+    # cv2 / torch / ultralytics import cost overlaps with the splash
+    QThreadPool.globalInstance().start(warm_up)
+
+    windows: list[MainWindow] = []  # keep the main window alive
+
+    def _hide_splash() -> None:
+        splash.hide()
+        splash.deleteLater()
+
+    def _show_mode_dialog() -> None:
+        # closing the dialog must not end the (already running) event loop
+        app.setQuitOnLastWindowClosed(False)
+        dialog = ModeDialog()
+        dialog.setWindowModality(Qt.ApplicationModal)  # Make it properly modal
+        dialog.setWindowFlag(Qt.WindowStaysOnTopHint)  # Keep it on top
+        pick = dialog.exec_choice()  # True = live, False = video, None = cancel
+        app.setQuitOnLastWindowClosed(True)
+
+        if pick is None:
+            logger.info("Mode selection cancelled, exiting.")
+            app.quit()
+            return
+
+        logger.info("Mode selected: %s", "Live" if pick else "Video")
+
+        # Create and show the main window *after* mode is chosen
+        from stride_studio.gui.main_window import MainWindow
+
+        main_win = MainWindow(live=pick)
+        main_win.show()
+        windows.append(main_win)
+
+    # the dialog is usable right away; the splash times out on its own (the
+    # timer still fires inside the dialog's modal loop)
+    QTimer.singleShot(SPLASH_MS, _hide_splash)
+    QTimer.singleShot(0, _show_mode_dialog)
     sys.exit(app.exec())
 
 
@@ -18,14 +18,28 @@ SIZES = [16, 32, 48, 256]
 
 # ── LOAD MASTER ICON ─────────────────────────────────────────────────────────
 img = Image.open(SRC)
+if img.format == "JPEG":
+    img.draft("RGB", (max(SIZES), max(SIZES)))  # let libjpeg pre-shrink on decode
 
 # ── GENERATE PNGs ────────────────────────────────────────────────────────────
-for s in SIZES:
+# Cascade largest → smallest: each Lanczos pass starts from the previous
+# (already small) size instead of the full-resolution master.
+icons = {}
+cur = img
+for s in sorted(SIZES, reverse=True):
+    cur = cur.resize((s, s), Image.LANCZOS)
+    icons[s] = cur
     out_png = DST / f"icon_{s}x{s}.png"
-    img.resize((s, s), Image.LANCZOS).save(out_png)
+    cur.save(out_png)
     print(f"Saved {out_png}")
 
 # ── PACK WINDOWS .ICO ─────────────────────────────────────────────────────────
 ico_out = DST / "icon.ico"
-img.save(ico_out, format="ICO", sizes=[(s, s) for s in SIZES])
+largest, *rest = sorted(SIZES, reverse=True)
+icons[largest].save(
+    ico_out,
+    format="ICO",
+    sizes=[(s, s) for s in SIZES],
+    append_images=[icons[s] for s in rest],
+)
 print(f"Saved {ico_out}")
@@ -2,6 +2,9 @@
 """
 Utility script that creates the stride-studio splash-screen pixmap and saves
 the resulting image to simple_splash_save/recordings/splash_image.png.
+
+It also pre-renders the splash base image into the user cache, so the first
+launch after an install skips the smooth-scale as well.
 """
 
 from __future__ import annotations
@@ -19,7 +22,7 @@ REPO_ROOT = Path(__file__).resolve().parent
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
-from stride_studio.gui.splash_screen import create_splash_pixmap
+from stride_studio.gui.splash_screen import create_splash_pixmap, load_splash_pixmap
 
 
 def main() -> None:
@@ -40,6 +43,9 @@ def main() -> None:
     print(f"File exists: {output_path.exists()}")
     print(f"File path: {output_path}")
 
+    # Warm the cache StrideStudioSplash loads from
+    load_splash_pixmap()
+
 
 if __name__ == "__main__":
     sys.exit(main())
@@ -7,19 +7,20 @@ from __future__ import annotations
 
 # stdlib
 from pathlib import Path
-from typing import List, Tuple, Dict
+from typing import List, Tuple, Dict, TYPE_CHECKING
 
 # third-party
-import cv2
 import numpy as np
-import torch
-from ultralytics import YOLO
 
 import logging
 
+# torch / ultralytics / cv2 are imported lazily – they cost seconds at start-up
+if TYPE_CHECKING:
+    from ultralytics import YOLO
+
 log = logging.getLogger("stride_studio.core.models")
 
-__all__ = ["YoloPose", "YoloGeneric"]
+__all__ = ["YoloPose", "YoloGeneric", "MAX_BATCH", "unload_model", "warm_up"]
 
 # ─────────────────────────────────────────────────────────────────── pose ──
 _SKELETON: List[Tuple[int, int]] = [
@@ -47,22 +48,233 @@ JOINT_R = 4
 BONE_W = 3
 CONF_TH = 0.05
 
+# bone endpoints as index arrays → one fancy-index per frame, no Python loop
+_SK_A = np.array([a for a, _ in _SKELETON])
+_SK_B = np.array([b for _, b in _SKELETON])
+
+
+def _draw_skeleton(out: np.ndarray, kpts: np.ndarray, conf: np.ndarray) -> None:
+    """Draw every person's bones + joints onto *out* (N,17,2 / N,17)."""
+    if kpts.ndim != 3 or kpts.shape[0] == 0 or kpts.shape[1] != 17:
+        return
+    import cv2
+
+    h, w = out.shape[:2]
+
+    # bones: bounds are checked on the truncated pixel coordinates
+    ipts = kpts.astype(np.int32)
+    in_px = (
+        (ipts[..., 0] > 0)
+        & (ipts[..., 0] < w)
+        & (ipts[..., 1] > 0)
+        & (ipts[..., 1] < h)
+    )
+    ok_px = in_px & (conf >= CONF_TH)
+    bones = ok_px[:, _SK_A] & ok_px[:, _SK_B]  # (N,M)
+    if bones.any():
+        segs = np.stack([ipts[:, _SK_A], ipts[:, _SK_B]], axis=2)[bones]  # (S,2,2)
+        cv2.polylines(out, list(segs), False, BONE_COLOR, BONE_W)
+
+    # joints
+    joints = (
+        (conf >= CONF_TH)
+        & (kpts[..., 0] > 0)
+        & (kpts[..., 0] < w)
+        & (kpts[..., 1] > 0)
+        & (kpts[..., 1] < h)
+    )
+    for x, y in ipts[joints]:
+        cv2.circle(out, (int(x), int(y)), JOINT_R, JOINT_COLOR, -1)
+
+
 # ───────────────────────────────────────────────────────────── shared cache ─
-_MODEL_CACHE: Dict[str, YOLO] = {}
+# (weights, use exports, FP16, input size): Ultralytics fixes the precision
+# when a YOLO object first builds its predictor (and halves .pt weights in
+# place), so each precision needs its own object; exports are size-specific
+_MODEL_CACHE: Dict[Tuple[str, bool, bool, int | None], YOLO] = {}
+_CUDA_OK: bool | None = None
+
+# exported siblings of a ``.pt`` checkpoint, fastest first:
+# (Ultralytics export format, file suffix, device kind or None for any)
+_EXPORTS: List[Tuple[str, str, str | None]] = [
+    ("engine", ".engine", "cuda"),  # TensorRT FP16
+    ("onnx", ".onnx", "cpu"),  # ONNX Runtime
+    ("torchscript", ".torchscript", None),
+]
+# largest batch a dynamic-shape export accepts (see ``batch_size`` in the GUI)
+MAX_BATCH = 16
+
+
+def _cuda_ok() -> bool:
+    """``torch.cuda.is_available()``, probed once (driver init is slow)."""
+    global _CUDA_OK
+    if _CUDA_OK is None:
+        import torch
+
+        _CUDA_OK = torch.cuda.is_available()
+    return _CUDA_OK
+
+
+def warm_up() -> bool:
+    """
+    Import cv2 / torch / ultralytics and probe CUDA – meant for a background
+    thread, so neither the main window nor the first model load pays for
+    them on the GUI thread.
+    Cheap to call again once done. Returns whether CUDA is usable.
+    """
+    try:
+        import cv2  # noqa: F401
+        from ultralytics import YOLO  # noqa: F401
+
+        return _cuda_ok()
+    except Exception:  # surfaced again on first real use
+        log.debug("Background preload failed", exc_info=True)
+        return False
+
+
+def _target_device(device: str | None) -> str:
+    return device if device is not None else ("cuda:0" if _cuda_ok() else "cpu")
+
+
+def _is_fresh(export: Path, source: Path) -> bool:
+    """True if *export* exists and was produced after *source* last changed."""
+    return export.is_file() and export.stat().st_mtime >= source.stat().st_mtime
+
+
+def _use_half(half: bool | None, device: str) -> bool:
+    """FP16 policy: None → on whenever running on CUDA; never on CPU."""
+    on_cuda = device.startswith("cuda")
+    return on_cuda if half is None else bool(half) and on_cuda
+
+
+def _export_path(path: Path, suffix: str, half: bool, imgsz: int | None) -> Path:
+    """Cached export of checkpoint *path*, named after its input size + precision."""
+    size = imgsz or "native"
+    return path.with_name(f"{path.stem}.{size}.{'fp16' if half else 'fp32'}{suffix}")
+
+
+def _failed_marker(export: Path) -> Path:
+    """Marker left when *export* could not be built or loaded."""
+    return export.with_name(f"{export.name}.failed")
+
+
+def _mark_failed(export: Path) -> None:
+    """Skip *export* until its checkpoint changes (see :func:`_is_fresh`)."""
+    try:
+        _failed_marker(export).touch()
+    except OSError:  # read-only models dir – retried next launch
+        pass
+
+
+def _model_device(model: YOLO, device: str | None):
+    """Device of *model*; exported backends have none until first predict."""
+    import torch
+
+    return model.device or torch.device(_target_device(device))
+
+
+def _load_model(
+    weights: str | Path,
+    device: str | None = None,
+    *,
+    imgsz: int | None = None,
+    half: bool = False,
+    export: bool = True,
+) -> YOLO:
+    """
+    Load or fetch from cache.
+
+    Exported siblings of the checkpoint are preferred when they are newer
+    than the ``.pt`` (see :data:`_EXPORTS`). On a miss the ``.pt`` is loaded
+    and exported once, best format first, so the next launch skips the
+    Python-side model construction. ``export=False`` uses the plain ``.pt``
+    and never pays the one-time export. Exports are built and cached per
+    precision (*half*) and input size; ``imgsz=None`` exports at the size
+    the checkpoint was trained for (224 for cls, 1024 for OBB, …).
 
+    An export that fails to build or to load is marked ``.failed`` and not
+    tried again until the ``.pt`` changes; the ``.pt`` is used instead.
+    """
+    from ultralytics import YOLO
 
-def _load_model(weights: str | Path, device: str | None = None) -> YOLO:
-    """Load or fetch from cache."""
-    w = str(weights)
-    if w not in _MODEL_CACHE:
-        path = Path(__file__).resolve().parent.parent / "models" / w
+    key = (str(weights), export, half, imgsz)
+    if key not in _MODEL_CACHE:
+        path = Path(__file__).resolve().parent.parent / "models" / key[0]
         if not path.is_file():
             raise FileNotFoundError(path)
-        log.info("Loading model: %s on %s", path, device or "auto")
-        _MODEL_CACHE[w] = YOLO(str(path)).to(
-            device or "cuda:0" if torch.cuda.is_available() else "cpu"
-        )
-    return _MODEL_CACHE[w]
+        target = _target_device(device)
+        on_cuda = target.startswith("cuda")
+        kind = "cuda" if on_cuda else "cpu"
+        # (format, export file), skipping known-bad exports of this checkpoint
+        exports = [
+            (fmt, _export_path(path, sfx, half, imgsz))
+            for fmt, sfx, dev in _EXPORTS
+            if export and dev in (None, kind)
+        ]
+        exports = [(f, e) for f, e in exports if not _is_fresh(_failed_marker(e), path)]
+        size = {"imgsz": imgsz} if imgsz else {}  # else the checkpoint's own
+
+        for _, exported in exports:
+            if _is_fresh(exported, path):
+                # exported backends are placed via predict(device=…), not .to()
+                log.info("Loading model: %s on %s", exported, target)
+                model = YOLO(str(exported))
+                try:
+                    # backends load lazily: one dummy frame surfaces an engine
+                    # built for another GPU / TensorRT, or a missing runtime,
+                    # here instead of inside the processing pipeline
+                    model.predict(
+                        np.zeros((32, 32, 3), np.uint8),
+                        device=target,
+                        half=half,
+                        verbose=False,
+                        **size,
+                    )
+                except Exception:
+                    log.warning("Cannot use %s", exported, exc_info=True)
+                    _mark_failed(exported)
+                    continue
+                _MODEL_CACHE[key] = model
+                return model
+
+        log.info("Loading model: %s on %s", path, target)
+        model = YOLO(str(path)).to(target)
+        for fmt, exported in exports:
+            if _is_fresh(exported, path):
+                continue  # built before, but failed to load above
+            try:
+                out = model.export(
+                    format=fmt,
+                    device=target,
+                    half=half,
+                    **size,
+                    # engine / ONNX graphs are built for a fixed batch otherwise
+                    dynamic=fmt != "torchscript",
+                    batch=MAX_BATCH if fmt == "engine" else 1,
+                    verbose=False,
+                )
+                Path(out).replace(exported)
+                log.info("Cached %s export: %s", fmt, exported)
+                break
+            except Exception:
+                log.warning("%s export of %s failed", fmt, path, exc_info=True)
+                _mark_failed(exported)
+        _MODEL_CACHE[key] = model
+    return _MODEL_CACHE[key]
+
+
+def unload_model(model: YOLO) -> None:
+    """
+    Drop *model* (a wrapper's ``.model``) from the cache so its memory can be
+    freed once the last wrapper / thread lets go of it. Other variants of the
+    same checkpoint (precision, size, export) stay loaded.
+    """
+    for key in [k for k, m in _MODEL_CACHE.items() if m is model]:
+        del _MODEL_CACHE[key]
+    if _CUDA_OK:
+        import torch
+
+        torch.cuda.empty_cache()
 
 
 # ────────────────────────────────────────────────────────────── wrappers ───
@@ -74,56 +286,89 @@ class YoloPose:
     -------
     >>> model = YoloPose("yolo11x-pose.pt")
     >>> frame_bgr = model(frame_bgr)        # annotated in-place
+
+    The skeleton is drawn straight into *frame_bgr* – pass a copy if you
+    need the original pixels.
     """
 
     def __init__(
         self,
         ckpt: str | Path = "yolo11x-pose.pt",
         *,
-        imgsz: int = 640,
-        half: bool = False,
+        imgsz: int | None = None,
+        half: bool | None = None,
         device: str | None = None,
+        export: bool = True,
     ):
         self.ckpt = str(ckpt)
-        self.model = _load_model(self.ckpt, device)
-        if half and self.model.device.type == "cuda":
-            self.model.half()
-        self.imgsz = imgsz
-        self.device = self.model.device
+        # FP16 halves bandwidth on CUDA; None → on whenever the model is on GPU.
+        # Part of the model cache key: a shared YOLO object keeps the precision
+        # its first predict() was run with.
+        self.half = _use_half(half, _target_device(device))
+        self.model = _load_model(
+            self.ckpt, device, imgsz=imgsz, half=self.half, export=export
+        )
+        self.imgsz = imgsz  # None → the size the checkpoint / export was built for
+        self.device = _model_device(self.model, device)
+
+    def submit(self, frame_bgr: np.ndarray) -> tuple:
+        """
+        Run inference and *start* copying the keypoints to the host.
+
+        The device→host copy is asynchronous; :meth:`finalize` waits for it,
+        so the caller can overlap it with other work (e.g. the next read).
+        """
+        return self.submit_batch([frame_bgr])[0]
+
+    def submit_batch(self, frames: List[np.ndarray]) -> List[tuple]:
+        """Batched :meth:`submit`: one forward pass, one handle per frame."""
+        import torch
+
+        with torch.inference_mode():
+            results = self.model(
+                list(frames),
+                device=self.device,
+                half=self.half,
+                verbose=False,
+                **({"imgsz": self.imgsz} if self.imgsz else {}),
+            )
+
+            handles = []
+            for frame_bgr, res in zip(frames, results):
+                kp = res.keypoints
+                xy = kp.xy.to("cpu", non_blocking=True)  # (N,17,2)
+                # Fix for tensor boolean ambiguity
+                conf = (
+                    kp.conf.to("cpu", non_blocking=True)
+                    if kp.conf is not None
+                    else None
+                )
+                handles.append((frame_bgr, xy, conf))
+
+            # one event covers every copy queued above
+            ready = None
+            if results and results[0].keypoints.xy.is_cuda:
+                ready = torch.cuda.Event()
+                ready.record()
+        return [(f, xy, conf, ready) for f, xy, conf in handles]
+
+    def finalize(self, handle: tuple) -> np.ndarray:
+        """Wait for :meth:`submit`'s copy and draw the skeleton."""
+        frame_bgr, xy, conf, ready = handle
+        if ready is not None:
+            ready.synchronize()
+
+        kpts = xy.numpy()
+        conf = conf.numpy() if conf is not None else np.ones_like(kpts[..., 0])
+
+        # cv2 can only draw into C-contiguous memory (rotated views aren't)
+        if not frame_bgr.flags["C_CONTIGUOUS"]:
+            frame_bgr = np.ascontiguousarray(frame_bgr)
+        _draw_skeleton(frame_bgr, kpts, conf)  # in place, caller owns the buffer
+        return frame_bgr
 
-    @torch.inference_mode()
     def __call__(self, frame_bgr: np.ndarray) -> np.ndarray:
-        res = self.model(
-            frame_bgr, imgsz=self.imgsz, device=self.device, verbose=False
-        )[0]
-
-        kpts = res.keypoints.xy.cpu().numpy()  # (N,17,2)
-
-        # Fix for tensor boolean ambiguity
-        if res.keypoints.conf is not None:
-            conf = res.keypoints.conf.cpu().numpy()
-        else:
-            conf = np.ones_like(kpts[..., 0])
-
-        out = frame_bgr.copy()
-        h, w = out.shape[:2]
-
-        for pts, cf in zip(kpts, conf):
-            if pts.shape[0] != 17:
-                continue
-            # bones
-            for a, b in _SKELETON:
-                if cf[a] < CONF_TH or cf[b] < CONF_TH:
-                    continue
-                ax, ay = map(int, pts[a])
-                bx, by = map(int, pts[b])
-                if 0 < ax < w and 0 < ay < h and 0 < bx < w and 0 < by < h:
-                    cv2.line(out, (ax, ay), (bx, by), BONE_COLOR, BONE_W)
-            # joints
-            for (x, y), p in zip(pts, cf):
-                if p >= CONF_TH and 0 < x < w and 0 < y < h:
-                    cv2.circle(out, (int(x), int(y)), JOINT_R, JOINT_COLOR, -1)
-        return out
+        return self.finalize(self.submit(frame_bgr))
 
 
 class YoloGeneric:
@@ -135,13 +380,36 @@ class YoloGeneric:
     model's own overlay.
     """
 
-    def __init__(self, ckpt: str | Path, *, device: str | None = None):
+    def __init__(
+        self,
+        ckpt: str | Path,
+        *,
+        half: bool | None = None,
+        device: str | None = None,
+        export: bool = True,
+    ):
         self.ckpt = str(ckpt)
-        self.model = _load_model(self.ckpt, device)
-        self.device = self.model.device
+        # same FP16 policy as YoloPose
+        self.half = _use_half(half, _target_device(device))
+        self.model = _load_model(self.ckpt, device, half=self.half, export=export)
+        self.device = _model_device(self.model, device)
 
-    @torch.inference_mode()
-    def __call__(self, frame_bgr: np.ndarray) -> np.ndarray:
-        res = self.model(frame_bgr, device=self.device, verbose=False)[0]
+    def submit(self, frame_bgr: np.ndarray) -> tuple:
+        return self.submit_batch([frame_bgr])[0]
+
+    def submit_batch(self, frames: List[np.ndarray]) -> List[tuple]:
+        import torch
+
+        with torch.inference_mode():
+            results = self.model(
+                list(frames), device=self.device, half=self.half, verbose=False
+            )
+        return list(zip(frames, results))
+
+    def finalize(self, handle: tuple) -> np.ndarray:
+        frame_bgr, res = handle
         plotted = res.plot()  # always returns BGR ndarray
         return plotted if isinstance(plotted, np.ndarray) else frame_bgr
+
+    def __call__(self, frame_bgr: np.ndarray) -> np.ndarray:
+        return self.finalize(self.submit(frame_bgr))
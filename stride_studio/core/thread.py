@@ -5,17 +5,120 @@
 # ---------------------------------------------------------------------------
 from __future__ import annotations
 
-import cv2, gc, logging, time
+import cv2, gc, logging, os, queue, shutil, sys, tempfile, threading, time
 from pathlib import Path
 from typing import Any
 
 import numpy as np
-from PySide6.QtCore import QThread, QObject, Signal, QMutex, QWaitCondition
-from PySide6.QtGui import QImage, QPixmap
-from ultralytics import YOLO
+from PySide6.QtCore import (
+    QThread,
+    QObject,
+    Signal,
+    QMutex,
+    QWaitCondition,
+    QElapsedTimer,
+    QSize,
+)
+from PySide6.QtGui import QImage
 
 log = logging.getLogger("stride_studio.core.thread")
 
+# lossless temporary file used when no output path is known up-front
+SPOOL_FOURCC = "FFV1"
+SPOOL_SUFFIX = ".mkv"
+
+# minimum gap between preview pixmaps (ms): ~display rate when live,
+# coarser while exporting a file where throughput matters more
+PREVIEW_MS_LIVE = 16
+PREVIEW_MS_SAVE = 33
+
+# default frames buffered between pipeline stages (read → infer → deliver);
+# the blocking put()/get() on these bounded queues is the back-pressure
+PIPELINE_DEPTH = 8
+
+# a partial inference batch is flushed once frames stop arriving for this
+# long – or, from a live feed, once its oldest frame has waited this long
+BATCH_FLUSH_MS = 50
+
+_EOS = object()  # end-of-stream marker passed down the pipeline
+_YOLO: type | None = None
+
+
+def open_capture(path: str) -> cv2.VideoCapture:
+    """
+    Open a video file, asking FFmpeg for hardware decoding (any backend,
+    first device). Falls back to OpenCV's default backend when that fails.
+    """
+    hw = getattr(cv2, "CAP_PROP_HW_ACCELERATION", None)  # OpenCV >= 4.5.2
+    if hw is not None:
+        cap = cv2.VideoCapture(
+            path,
+            cv2.CAP_FFMPEG,
+            [hw, cv2.VIDEO_ACCELERATION_ANY, cv2.CAP_PROP_HW_DEVICE, 0],
+        )
+        if cap.isOpened():
+            return cap
+        cap.release()
+        log.info("Hardware decoding unavailable for %s – using default", path)
+    return cv2.VideoCapture(path)
+
+
+# live mode: camera indices probed, and the backends tried for each (best first)
+MAX_CAMERAS = 4
+_CAM_BACKENDS = (
+    [cv2.CAP_DSHOW, cv2.CAP_MSMF, cv2.CAP_ANY]
+    if sys.platform == "win32"
+    else [cv2.CAP_ANY]
+)
+
+
+def open_camera(idx: int) -> tuple[cv2.VideoCapture | None, int]:
+    """
+    Open camera *idx* with the first backend in :data:`_CAM_BACKENDS` that
+    works → ``(capture, backend)``, or ``(None, CAP_ANY)`` if none does.
+    """
+    for backend in _CAM_BACKENDS:
+        cap = cv2.VideoCapture(idx, backend)
+        if cap.isOpened():
+            return cap, backend
+        cap.release()
+    return None, cv2.CAP_ANY
+
+
+def probe_cameras(max_index: int = MAX_CAMERAS, *, skip=()) -> dict[int, int]:
+    """
+    ``{camera index: first backend that opens it}``, leaving out *skip*.
+
+    Slow – every failed attempt builds and tears down a capture graph – so
+    run it once, off the GUI thread, and open cameras with the cached backend.
+    """
+    found: dict[int, int] = {}
+    for idx in range(max_index):
+        if idx in skip:
+            continue
+        cap, backend = open_camera(idx)
+        if cap is not None:
+            cap.release()
+            found[idx] = backend
+    log.info("Cameras found: %s", sorted(found) or "none")
+    return found
+
+
+def _drain(q: queue.Queue) -> None:
+    """Discard items from *q* until the producer's end-of-stream marker."""
+    while q.get() is not _EOS:
+        pass
+
+
+def _yolo() -> type:
+    """``ultralytics.YOLO``, imported on first use (it drags in torch)."""
+    global _YOLO
+    if _YOLO is None:
+        from ultralytics import YOLO
+
+        _YOLO = YOLO
+    return _YOLO
+
 
 # --------------------------------------------------------------------------- #
 class VideoProcessingThread(QThread):
@@ -24,13 +127,18 @@ class VideoProcessingThread(QThread):
 
     * reads frames between *start_frame* and *end_frame* OR from live feed
     * rotates if required
-    * runs the model (wrapper **or** raw `ultralytics.YOLO`)
-    * emits live preview via ``change_pix``
-    * stores every annotated frame so :meth:`save_video` can be called later
+    * runs the model (wrapper **or** raw `ultralytics.YOLO`) on a separate
+      pipeline stage, overlapping decode and drawing (see :meth:`run`)
+    * emits live preview via ``change_frame``
+    * streams every annotated frame to disk (``output_path`` or a temporary
+      lossless spool) so :meth:`save_video` can be called later
     """
 
     # Qt signals
-    change_pix = Signal(QPixmap)  # live preview
+    # live preview as a QImage: implicitly shared, so the queued connection
+    # hands the GUI thread a reference instead of a deep copy, and the single
+    # QPixmap upload happens on the GUI thread where pixmaps belong
+    change_frame = Signal(QImage)
     progress = Signal(int)  # 0-100
     finished_ok = Signal(str)  # final status
 
@@ -44,6 +152,10 @@ class VideoProcessingThread(QThread):
         start_frame: int = 0,
         end_frame: int = -1,
         rotation_angle: int = 0,
+        batch_size: int = 1,
+        prefetch: int = PIPELINE_DEPTH,
+        output_path: str | Path | None = None,
+        fourcc: str = SPOOL_FOURCC,
         parent: QObject | None = None,
     ):
         super().__init__(parent)
@@ -54,15 +166,33 @@ class VideoProcessingThread(QThread):
         self.frame_end = end_frame
         self.rotation_angle = rotation_angle
         self.live_mode = live_capture is not None
+        self.batch_size = max(1, batch_size)  # frames per forward pass
+        self.prefetch = max(1, prefetch)  # frames queued between stages
+        self._bind_model()
 
         # populated in run() or from live_capture
         self.total = 0
         self.fps = 30.0
 
         self.current_frame = 0
-        self._run_flag = True
+        self._stop_evt = threading.Event()  # cooperative cancel, see stop()
 
-        self.processed_frames: list[np.ndarray] = []  # for save_video()
+        # annotated frames go straight to disk – O(1) memory
+        self.output_path = str(output_path) if output_path else ""
+        self.fourcc = fourcc if output_path else SPOOL_FOURCC
+        self.frames_written = 0
+        self._writer: cv2.VideoWriter | None = None
+        self._writer_path = ""  # output_path, or the temp spool
+        self._writer_failed = False
+
+        self._qimg: QImage | None = None  # reused preview surface
+        self._preview_size: tuple[int, int] | None = None  # view size (w, h)
+        self._held: np.ndarray | None = None  # newest frame not yet previewed
+        self._error: BaseException | None = None  # first pipeline stage error
+
+        # preview throttling (see _deliver)
+        self._preview_ms = PREVIEW_MS_SAVE
+        self._last_emit = QElapsedTimer()
 
         # mutex/cond → pause / resume (GUI slider drag)
         self.mutex = QMutex()
@@ -72,7 +202,7 @@ class VideoProcessingThread(QThread):
     def prepare(self) -> bool:
         """Prepare the video capture source."""
         if self.cap is None:  # Open file only if not in live mode
-            self.cap = cv2.VideoCapture(self.path)
+            self.cap = open_capture(self.path)
             if not self.cap.isOpened():
                 log.error("Failed to open video file: %s", self.path)
                 return False
@@ -91,38 +221,95 @@ class VideoProcessingThread(QThread):
         return True
 
     # ────────────────────────── helpers ───────────────────────────────── #
-    @staticmethod
-    def _pm_from_bgr(arr: np.ndarray) -> QPixmap:
+    def _qimg_view(self, w: int, h: int) -> np.ndarray:
+        """
+        (h, w, 3) numpy view onto the thread's persistent preview QImage,
+        which is only reallocated when the size changes.
+
+        Writing through ``bits()`` detaches the image (copy-on-write) only if
+        the GUI thread still holds the previously emitted frame, so the
+        emitted QImage never aliases a buffer that is about to be recycled.
+        """
+        if self._qimg is None or (self._qimg.width(), self._qimg.height()) != (w, h):
+            self._qimg = QImage(w, h, QImage.Format_BGR888)
+        rows = np.frombuffer(self._qimg.bits(), np.uint8).reshape(
+            h, self._qimg.bytesPerLine()
+        )
+        return rows[:, : 3 * w].reshape(h, w, 3)
+
+    def _qimg_from_bgr(self, arr: np.ndarray) -> QImage:
+        """Copy *arr* into the persistent preview QImage and return it."""
         h, w = arr.shape[:2]
-        return QPixmap.fromImage(QImage(arr.data, w, h, 3 * w, QImage.Format_BGR888))
+        np.copyto(self._qimg_view(w, h), arr)  # also handles views
+        return self._qimg
+
+    def _preview_image(self, arr: np.ndarray) -> QImage:
+        """
+        Preview of *arr*, area-downscaled to fit :meth:`set_preview_size` so
+        the GUI thread only has to blit it. The resize writes straight into
+        the QImage – one pass over the frame, no intermediate array.
+        """
+        if self._preview_size is not None:
+            h, w = arr.shape[:2]
+            vw, vh = self._preview_size
+            scale = min(vw / w, vh / h)
+            if scale < 1:
+                size = (max(1, round(w * scale)), max(1, round(h * scale)))
+                dst = self._qimg_view(*size)
+                cv2.resize(arr, size, dst=dst, interpolation=cv2.INTER_AREA)
+                return self._qimg
+        return self._qimg_from_bgr(arr)
 
     def _apply_rotation(self, fr: np.ndarray) -> np.ndarray:
+        """
+        180° is returned as a zero-copy (negative-stride) view; consumers that
+        need contiguous memory copy it once themselves. 90/270° still go
+        through ``cv2.rotate`` – a transposed view would stay non-contiguous
+        through Ultralytics' ``plot()`` and break drawing on it.
+        """
         rot = self.rotation_angle % 360
         if rot == 90:
             return cv2.rotate(fr, cv2.ROTATE_90_CLOCKWISE)
         elif rot == 180:
-            return cv2.rotate(fr, cv2.ROTATE_180)
+            return fr[::-1, ::-1]
         elif rot == 270:
             return cv2.rotate(fr, cv2.ROTATE_90_COUNTERCLOCKWISE)
         return fr
 
-    def _infer_and_annotate(self, bgr: np.ndarray) -> np.ndarray:
+    def _bind_model(self) -> None:
         """
-        Accepts either:
+        Resolve how to drive ``self.model`` once – its type is fixed for the
+        thread's lifetime. Accepts either:
 
-        * our lightweight wrapper (callable → BGR ndarray)
+        * our lightweight wrapper (``submit`` / ``finalize`` pair)
         * a raw ``ultralytics.YOLO`` model
+
+        ``_submit_batch(frames)`` runs one forward pass and returns a handle
+        per frame; ``_finalize(handle)`` waits for its results and returns
+        the annotated BGR frame.
         """
-        if not isinstance(self.model, YOLO):
+        if isinstance(self.model, _yolo()):
+            self._submit_batch, self._finalize = self._submit_raw, self._finalize_raw
+        else:
             # wrapper already returns BGR
-            return self.model(bgr)
+            self._finalize = self.model.finalize
+            self._submit_batch = getattr(self.model, "submit_batch", None) or (
+                lambda frames: [self.model.submit(f) for f in frames]
+            )
 
-        # raw YOLO object
-        res = self.model(bgr, verbose=False)[0]
+    def _submit_raw(self, frames: list[np.ndarray]) -> list[Any]:
+        return list(zip(frames, self.model(frames, verbose=False)))
+
+    def _finalize_raw(self, handle: Any) -> np.ndarray:
+        bgr, res = handle
         plotted = res.plot()
         return plotted if isinstance(plotted, np.ndarray) else bgr
 
     # ─────────────────────────── public slots ────────────────────────────
+    def set_preview_size(self, size: QSize) -> None:
+        """Largest preview the GUI shows; bigger frames are scaled down here."""
+        self._preview_size = (size.width(), size.height()) if size.isValid() else None
+
     def pause(self):
         self.mutex.lock()
         self._pause = True
@@ -134,17 +321,89 @@ class VideoProcessingThread(QThread):
         self.mutex.unlock()
         self.cond.wakeAll()
 
+    def stop(self):
+        """
+        Ask every pipeline stage to wind down and return immediately;
+        ``finished`` fires once they have. Queued frames are discarded.
+        """
+        self.mutex.lock()
+        self._stop_evt.set()
+        self.mutex.unlock()
+        self.cond.wakeAll()  # a paused reader must see the stop too
+
     # ─────────────────────────── QThread.run ─────────────────────────────
     def run(self) -> None:
+        """
+        Three stages, each on its own thread, joined by bounded queues:
+
+        * read   – ``cap.read`` + rotation               → ``decoded``
+        * infer  – batched forward pass (``_submit_batch``) → ``inferred``
+        * deliver (this thread) – ``_finalize``, export, preview, progress
+
+        Decode, GPU inference and drawing overlap; the small queues provide
+        back-pressure so a slow stage never lets frames pile up in memory.
+        """
         if not self.prepare():
             self.finished_ok.emit("Cannot open video source.")
             return
 
+        self._preview_ms = PREVIEW_MS_LIVE if self.live_mode else PREVIEW_MS_SAVE
+        self._last_emit.invalidate()
+        self._held = None
+        self._error = None
+
+        # deep enough for the reader to fill the next batch during inference
+        depth = max(self.prefetch, self.batch_size)
+        decoded: queue.Queue = queue.Queue(maxsize=depth)
+        inferred: queue.Queue = queue.Queue(maxsize=depth)
+        stages = [
+            threading.Thread(
+                target=self._read_stage, args=(decoded,), name="stride-read"
+            ),
+            threading.Thread(
+                target=self._infer_stage, args=(decoded, inferred), name="stride-infer"
+            ),
+        ]
+        for t in stages:
+            t.start()
+
         try:
-            while self._run_flag and self.current_frame < self.frame_end:
-                # handle pause ------------------------------------------
+            self._deliver_stage(inferred)
+            if self._error is not None:
+                raise self._error
+        except Exception as e:
+            log.exception("Thread error")
+            self.finished_ok.emit(f"Error: {e}")
+        finally:
+            for t in stages:
+                t.join()
+            if not self.live_mode and self.cap:  # Only release if opened by this thread
+                self.cap.release()
+            self._close_writer()
+            self._held = None
+            # the finished thread is kept around for save_video(); it must not
+            # pin the model (and its VRAM) once the GUI evicts it
+            self.model = self._submit_batch = self._finalize = None
+            self._error = None  # its traceback holds the stages' tensors
+            gc.collect()
+            self.finished_ok.emit("Processing complete.")
+
+    def _stopping(self) -> bool:
+        return self._stop_evt.is_set()
+
+    def _fail(self, exc: BaseException) -> None:
+        """Record the first stage error and wind the pipeline down."""
+        if self._error is None:
+            self._error = exc
+        self._stop_evt.set()
+
+    def _read_stage(self, out: queue.Queue) -> None:
+        try:
+            idx = self.frame_start
+            while not self._stopping() and idx < self.frame_end:
+                # handle pause (frames already queued still drain) -------
                 self.mutex.lock()
-                while self._pause:
+                while self._pause and not self._stopping():
                     self.cond.wait(self.mutex)
                 self.mutex.unlock()
 
@@ -158,50 +417,175 @@ class VideoProcessingThread(QThread):
                         log.warning("Early EOF")
                         break
 
-                raw = self._apply_rotation(raw)
-                annotated = self._infer_and_annotate(raw)
-
-                # buffer + preview
-                if not self.live_mode:
-                    self.processed_frames.append(annotated.copy())
-
-                self.change_pix.emit(self._pm_from_bgr(annotated))
-
-                if not self.live_mode:
-                    pct = int(
-                        100
-                        * (self.current_frame - self.frame_start)
-                        / max(1, self.frame_end - self.frame_start)
-                    )
-                    self.progress.emit(pct)
-                else:
-                    # Live mode doesn't have fixed progress
-                    self.progress.emit(50)  # Or some other indicator
-
-                self.current_frame += 1
+                out.put((idx, self._apply_rotation(raw)))
+                idx += 1
+                self.current_frame = idx
+        except Exception as e:
+            self._fail(e)
+        finally:
+            out.put(_EOS)
 
+    def _infer_stage(self, inp: queue.Queue, out: queue.Queue) -> None:
+        eos = False
+        try:
+            while not eos and (item := inp.get()) is not _EOS:
+                if self._stopping():
+                    continue  # discard what is still queued
+                batch, eos = self._fill_batch(inp, [item])
+                idxs, frames = zip(*batch)
+                for idx, handle in zip(idxs, self._submit_batch(list(frames))):
+                    out.put((idx, handle))
         except Exception as e:
-            log.exception("Thread error")
-            self.finished_ok.emit(f"Error: {e}")
+            self._fail(e)
+            if not eos:
+                _drain(inp)  # unblock the reader until it sees the stop flag
         finally:
-            if not self.live_mode and self.cap:  # Only release if opened by this thread
-                self.cap.release()
-            gc.collect()
-            self.finished_ok.emit("Processing complete.")
+            out.put(_EOS)
+
+    def _fill_batch(self, inp: queue.Queue, batch: list) -> tuple[list, bool]:
+        """Top *batch* up to ``batch_size`` frames; also report end-of-stream."""
+        flush = BATCH_FLUSH_MS / 1000
+        deadline = time.monotonic() + flush if self.live_mode else None
+        while len(batch) < self.batch_size:
+            wait = flush if deadline is None else deadline - time.monotonic()
+            if wait <= 0:
+                break
+            try:
+                item = inp.get(timeout=wait)
+            except queue.Empty:
+                break
+            if item is _EOS:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _deliver_stage(self, inp: queue.Queue) -> None:
+        try:
+            while True:
+                try:
+                    item = inp.get(timeout=self._preview_ms / 1000)
+                except queue.Empty:
+                    # upstream is idle (paused / slow camera): show what the
+                    # throttle held back instead of leaving a stale preview
+                    self._flush_preview()
+                    continue
+                if item is _EOS:
+                    break
+                if self._stopping():
+                    continue  # interrupted: don't export the tail
+                idx, handle = item
+                self._deliver(self._finalize(handle), idx)
+            self._flush_preview()
+        except BaseException:
+            self._stop_evt.set()
+            _drain(inp)
+            raise
+
+    def _deliver(self, annotated: np.ndarray, idx: int) -> None:
+        """Export + preview + progress for frame *idx*."""
+        if not self.live_mode:
+            self._write(annotated)
+
+        # skip frames the display could not show anyway (see _flush_preview)
+        if (
+            not self._last_emit.isValid()
+            or self._last_emit.elapsed() >= self._preview_ms
+        ):
+            self._held = None
+            self.change_frame.emit(self._preview_image(annotated))
+            self._last_emit.start()
+        else:
+            self._held = annotated
+
+        if not self.live_mode:
+            pct = int(
+                100
+                * (idx + 1 - self.frame_start)
+                / max(1, self.frame_end - self.frame_start)
+            )
+            self.progress.emit(pct)
+        else:
+            # Live mode doesn't have fixed progress
+            self.progress.emit(50)  # Or some other indicator
+
+    def _flush_preview(self) -> None:
+        """Emit the newest frame the preview throttle skipped, if any."""
+        if self._held is not None:
+            self.change_frame.emit(self._preview_image(self._held))
+            self._last_emit.start()
+            self._held = None
 
     # ─────────────────────────── save video ──────────────────────────────
+    def _write(self, frame: np.ndarray) -> None:
+        """Append *frame* to the output, opening the writer on first use."""
+        if self._writer is None:
+            if self._writer_failed:
+                return
+            if self.output_path:
+                path = self.output_path
+            else:
+                fd, path = tempfile.mkstemp(prefix="stride_", suffix=SPOOL_SUFFIX)
+                os.close(fd)
+            h, w = frame.shape[:2]
+            writer = cv2.VideoWriter(
+                path, cv2.VideoWriter_fourcc(*self.fourcc), self.fps, (w, h)
+            )
+            if not writer.isOpened():
+                log.error("Cannot write %s – annotated video will not be kept", path)
+                self._writer_failed = True
+                return
+            self._writer, self._writer_path = writer, path
+        self._writer.write(frame)
+        self.frames_written += 1
+
+    def _close_writer(self) -> None:
+        if self._writer is not None:
+            self._writer.release()
+            self._writer = None
+
+    def discard_output(self) -> None:
+        """Delete the temporary spool file (no-op for an explicit output_path)."""
+        self._close_writer()
+        if self._writer_path and not self.output_path:
+            try:
+                os.remove(self._writer_path)
+            except OSError:
+                pass
+        self._writer_path = ""
+        self.frames_written = 0
+
     def save_video(self, out_path: str, fourcc: str = "FFV1") -> tuple[bool, str]:
-        if not self.processed_frames:
+        if self.isRunning():
+            return False, "Processing is still running."
+        if not (self.frames_written and self._writer_path):
             return False, "No frames processed."
+        if os.path.abspath(out_path) == os.path.abspath(self._writer_path):
+            return True, f"Saved → {out_path}"
 
-        h, w = self.processed_frames[0].shape[:2]
+        same_ext = (
+            Path(out_path).suffix.lower() == Path(self._writer_path).suffix.lower()
+        )
+        if fourcc == self.fourcc and same_ext:
+            shutil.copyfile(self._writer_path, out_path)
+            return True, f"Saved → {out_path}"
+
+        # different container / codec → re-encode frame by frame from disk
+        src = cv2.VideoCapture(self._writer_path)
+        ok, fr = src.read()
+        if not ok:
+            src.release()
+            return False, f"Cannot read {self._writer_path}"
+        h, w = fr.shape[:2]
         writer = cv2.VideoWriter(
             out_path, cv2.VideoWriter_fourcc(*fourcc), self.fps, (w, h)
         )
         if not writer.isOpened():
+            src.release()
             return False, f"Cannot write {out_path}"
 
-        for fr in self.processed_frames:
+        while ok:
             writer.write(fr)
+            ok, fr = src.read()
         writer.release()
+        src.release()
         return True, f"Saved → {out_path}"
@@ -7,12 +7,22 @@ from __future__ import annotations
 
 # ── std-lib ──────────────────────────────────────────────────────────────
 import datetime, logging
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional
 
 # ── third-party ──────────────────────────────────────────────────────────
 import cv2
-from PySide6.QtCore import Qt, QTimer, Slot, Signal, QSize
+import numpy as np
+from PySide6.QtCore import (
+    Qt,
+    QTimer,
+    Slot,
+    Signal,
+    QSize,
+    QElapsedTimer,
+    QThreadPool,
+)
 from PySide6.QtGui import QCloseEvent, QDropEvent
 from PySide6.QtWidgets import (
     QApplication,
@@ -37,10 +47,16 @@ from PySide6.QtWidgets import (
 # ── local ────────────────────────────────────────────────────────────────
 from ..core.thread import (
     VideoProcessingThread,
+    open_capture,
+    open_camera,
+    probe_cameras,
 )  # pylint: disable=import-error
 from ..core.models import (
     YoloPose,
     YoloGeneric,
+    MAX_BATCH,
+    unload_model,
+    warm_up,
 )  # pylint: disable=import-error
 from ..utils.logger import get_logger  # pylint: disable=import-error
 from ..utils.theme import dark_theme  # pylint: disable=import-error
@@ -62,12 +78,30 @@ _TASK2CKPT = {
 
 SUP_EXT = (".mp4", ".avi", ".mov", ".mkv", ".wmv")
 
+# forward seeks up to this many frames decode-skip with grab() instead of a
+# keyframe seek + re-decode via CAP_PROP_POS_FRAMES
+GRAB_SEEK_MAX = 8
+
+# loaded model wrappers kept around for quick task switching (VRAM bound)
+MODEL_CACHE_SIZE = 2
+
+# a shutdown still waiting for the processing thread after this long logs it
+THREAD_STOP_MS = 5000
+
+# frames per forward pass offered in the UI (larger keeps the GPU busier)
+BATCH_SIZES = [b for b in (1, 2, 4, 8, 16) if b <= MAX_BATCH]
+
 # ---------------------------------------------------------------------------
 
 
 class MainWindow(QMainWindow):
     """Controller that glues together widgets + processing logic."""
 
+    camera_opened = Signal(object)  # (index, capture or None, backend), ditto
+    cameras_found = Signal(object)  # {index: backend}, from a pool thread
+    model_loaded = Signal(object)  # (cache key, wrapper or exception), ditto
+    cuda_probed = Signal(bool)  # CUDA usable, from the warm-up pool job
+
     def __init__(self, *, live: bool = False):
         super().__init__()
         self.setWindowTitle("Stride Studio")
@@ -76,24 +110,54 @@ class MainWindow(QMainWindow):
         # ---------- widgets ------------------------------------------------
         self._build_ui()
 
+        # torch / ultralytics import off the GUI thread, long before the
+        # first model load needs it (no-op if the launcher already did);
+        # its CUDA probe picks the default batch size
+        self.cuda_probed.connect(self._on_cuda_probed)
+        QThreadPool.globalInstance().start(lambda: self.cuda_probed.emit(warm_up()))
+
         # ---------- run-time state ----------------------------------------
         self.live_mode = live
         self.selected_cam = 0
+        self.available_cameras: dict[int, int] = {}  # index → working backend
         self.cap: Optional[cv2.VideoCapture] = None
         self.thread: Optional[VideoProcessingThread] = None
         self.yolo_model = None
+        # (task, fp16, export) → wrapper, least recently used first
+        self._model_cache: OrderedDict[tuple, YoloPose | YoloGeneric] = OrderedDict()
+        self._loading: tuple | None = None  # key of the model being loaded
         self.video_loaded = False
         self.is_playing = False
         self.fps = 30.0
         self.cur_frame = 0
         self.tot_frames = 0
+        # False for live sources: no frame count, so the slider is left alone
+        self._seekable = False
         self.rotation = 0
         self.speed = 1.0
         self.video_path: str | None = None
+        # preview frames are decoded into this array; VideoView.show takes
+        # each shown frame and hands back a spare one (or None) for the next
+        self._frame_buf: np.ndarray | None = None
 
-        # playback timer
+        # playback: a single-shot timer re-armed by _tick, paced against a
+        # monotonic clock so interval rounding never accumulates into drift
         self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(Qt.PreciseTimer)
         self.timer.timeout.connect(self._tick)
+        self._clock = QElapsedTimer()
+        self._clock_origin = 0  # cur_frame when _clock was started
+
+        # seeks are throttled to one per frame interval; the newest wins
+        self._seek_timer = QTimer(self)
+        self._seek_timer.setSingleShot(True)
+        self._seek_timer.timeout.connect(self._flush_seek)
+        self._pending_seek: int | None = None
+
+        # preview frames: only the newest is painted (see _on_frame)
+        self._pending_img = None
+        self._flush_scheduled = False
 
         # ---------- signal wiring -----------------------------------------
         self.transport.play.connect(self._play)
@@ -103,38 +167,63 @@ class MainWindow(QMainWindow):
         self.transport.seek.connect(self._seek_abs)
         self.transport.speed.connect(self._set_speed)
         self.transport.rotate.connect(self._rotate)
+        # scrubbing pauses processing; releasing the handle resumes it
+        self.transport.slider.sliderPressed.connect(
+            lambda: self.thread and self.thread.pause()
+        )
+        self.transport.slider.sliderReleased.connect(self._resume_thread_if_paused)
 
         self.files.open_video.connect(self.load_video)
+        self.files.camera_combo.setVisible(self.live_mode)
+        self.files.camera_combo.currentIndexChanged.connect(self._select_camera)
+        self.camera_opened.connect(self._on_camera_opened)
+        self.cameras_found.connect(self._on_cameras_found)
+        self.model_loaded.connect(self._on_model_loaded)
         self.files.save_video.connect(self._save_video)
 
         self.model_combo.currentIndexChanged.connect(self._change_model)
 
         # auto-live prompt
         if self.live_mode:
-            QTimer.singleShot(100, self._open_camera)
+            # open the default camera, then enumerate the rest, in the
+            # background; the first live frame never waits for the scan
+            QThreadPool.globalInstance().start(self._find_cameras)
         else:
             QTimer.singleShot(300, self._initial_prompt)
 
+    @Slot(bool)
+    def _on_cuda_probed(self, cuda: bool) -> None:
+        # on CPU a batch only adds preview latency and stop time, no throughput
+        if cuda and self.batch_combo.currentIndex() == 0 and not self.thread:
+            self.batch_combo.setCurrentText(str(BATCH_SIZES[-1]))
+
     def _populate_models(self) -> None:
         """Populate the model selection combobox."""
         self.model_combo.addItems(list(_TASK2CKPT.keys()))
 
     def _change_model(self) -> None:
         """Handle model selection change: stop old thread, start new one."""
-        log.info(f"Model selection changed to: {self.model_combo.currentText()}")
+        log.info("Model selection changed to: %s", self.model_combo.currentText())
 
-        # Stop the current processing thread if it's running
+        # Stop the current processing thread if it's running; the restart is
+        # chained to its finished signal so the GUI never blocks on it
         if self.thread and self.thread.isRunning():
             log.info("Stopping current processing thread for model change...")
-            # Use a similar stopping mechanism as _cleanup_all
-            self.thread.requestInterruption()  # Signal the thread to stop
-            if not self.thread.wait(3000):  # Wait up to 3 seconds
-                log.warning("Processing thread did not stop gracefully. Terminating.")
-                self.thread.terminate()  # Force stop if necessary
-                self.thread.wait()  # Wait again after terminate
-            else:
-                log.info("Previous processing thread stopped.")
-            self.thread = None  # Clear the reference
+            stopping = self.thread
+            stopping.finished.connect(lambda: self._restart_processing(stopping))
+            stopping.stop()
+            return
+        self._restart_processing()
+
+    def _restart_processing(self, stopped: VideoProcessingThread | None = None) -> None:
+        if stopped is not None and stopped is not self.thread:
+            return  # replaced meanwhile: new source, cleanup or earlier restart
+        if self.thread and self.thread.isRunning():
+            return  # already restarted by an earlier model change
+        if self.thread:
+            log.info("Previous processing thread stopped.")
+            self.thread.discard_output()
+        self.thread = None
 
         # Start processing with the new model
         # Ensure video/camera is still loaded before restarting
@@ -155,6 +244,26 @@ class MainWindow(QMainWindow):
         self.model_combo = QComboBox()
         self._populate_models()
         model_cfg.addWidget(self.model_combo)
+        model_cfg.addSpacing(10)
+        model_cfg.addWidget(QLabel("Batch:"))
+        self.batch_combo = QComboBox()
+        self.batch_combo.addItems([str(b) for b in BATCH_SIZES])
+        # batching only pays off on a GPU; _on_cuda_probed raises it there
+        self.batch_combo.setCurrentText(str(BATCH_SIZES[0]))
+        self.batch_combo.setToolTip("Frames per inference pass")
+        model_cfg.addWidget(self.batch_combo)
+        model_cfg.addSpacing(10)
+        self.fp16_chk = QCheckBox("FP16")
+        self.fp16_chk.setChecked(True)
+        self.fp16_chk.setToolTip("Half-precision inference (CUDA only)")
+        model_cfg.addWidget(self.fp16_chk)
+        self.export_chk = QCheckBox("Optimise model")
+        self.export_chk.setChecked(True)
+        self.export_chk.setToolTip(
+            "Export the checkpoint to TensorRT (CUDA) or ONNX (CPU) on first use "
+            "and load the export afterwards – the first run takes longer"
+        )
+        model_cfg.addWidget(self.export_chk)
         model_cfg.addStretch()
         main_layout.addLayout(model_cfg)
 
@@ -171,37 +280,7 @@ class MainWindow(QMainWindow):
         self.files = FileBar()
         main_layout.addWidget(self.files)
 
-        # Connect signals from widgets
-        self.transport.play.connect(
-            self.toggle_play_pause
-        )  # Assuming play signal handles toggle
-        self.transport.seek.connect(
-            self._seek
-        )  # Assuming seek signal emits absolute frame
-        self.transport.speed_changed.connect(
-            self._change_speed
-        )  # Assuming speed signal emits float
-        self.transport.rotated.connect(self._rotate)  # Assuming rotate signal exists
-        self.transport.next_frame.connect(self._next)  # Assuming next signal exists
-        self.transport.prev_frame.connect(self._previous)  # Assuming prev signal exists
-        self.transport.rewind.connect(self._rewind)  # Assuming rewind signal exists
-        self.transport.fast_forward.connect(
-            self._fast_forward
-        )  # Assuming ff signal exists
-        self.transport.slider_pressed.connect(
-            lambda: self.thread and self.thread.pause()
-        )
-        self.transport.slider_released.connect(lambda: self._resume_thread_if_paused())
-
-        self.files.open_video.connect(
-            self.load_video
-        )  # Assuming open signal has no args
-        self.files.save_video.connect(
-            self._save_video_clicked
-        )  # Assuming save signal has prefix arg
-
         self.statusBar().showMessage("Ready.")
-        self._reset_ui()
 
     def _resume_thread_if_paused(self):
         # When slider is released, resume thread if it was paused by slider press
@@ -215,7 +294,7 @@ class MainWindow(QMainWindow):
     def load_video(self, path: str):
         self._cleanup_all()
 
-        self.cap = cv2.VideoCapture(path)
+        self.cap = open_capture(path)
         if not self.cap.isOpened():
             QMessageBox.critical(self, "Error", f"Cannot open {path}")
             return
@@ -223,54 +302,102 @@ class MainWindow(QMainWindow):
         self.video_path = path
         self.fps = self.cap.get(cv2.CAP_PROP_FPS) or 30.0
         self.tot_frames = int(self.cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        self._seekable = True
         self.video_loaded = True
         self.cur_frame = 0
         ok, frame = self.cap.read()
         if not ok:
             QMessageBox.critical(self, "Error", "Cannot read first frame")
             return
-
-        self.view.show(frame)
+        # the view owns shown frames; it hands back a buffer to decode into
+        self._frame_buf = self.view.show(frame)
         self.transport.slider.setMaximum(max(0, self.tot_frames - 1))
         self._ui_state()
         log.info("Loaded video %s", Path(path).name)
 
     # ---------- live cam --------------------------------------------------
-    def _open_camera(self) -> bool:
+    def _find_cameras(self) -> None:
+        """Pool thread: open the selected camera first, then probe the rest."""
+        first = self.selected_cam
+        cap, backend = open_camera(first)
+        self.camera_opened.emit((first, cap, backend))
+        cams = probe_cameras(skip={first})
+        if cap is not None:
+            cams = dict(sorted({**cams, first: backend}.items()))
+        self.cameras_found.emit(cams)
+
+    @Slot(object)
+    def _on_camera_opened(self, opened: tuple) -> None:
+        idx, cap, backend = opened
+        if cap is None:
+            return  # _on_cameras_found falls back to another camera
+        self.available_cameras = {idx: backend}
+        self._fill_camera_combo()
+        self._open_camera(cap)
+
+    @Slot(object)
+    def _on_cameras_found(self, cams: dict) -> None:
+        already_open = self.video_loaded and self.selected_cam in cams
+        self.available_cameras = cams
+        if cams and self.selected_cam not in cams:
+            self.selected_cam = next(iter(cams))
+        self._fill_camera_combo()
+        if not already_open:
+            self._open_camera()
+
+    def _fill_camera_combo(self) -> None:
+        cams = self.available_cameras
+        combo = self.files.camera_combo
+        combo.blockSignals(True)
+        combo.clear()
+        combo.addItems([f"Camera {i}" for i in cams])
+        if self.selected_cam in cams:
+            combo.setCurrentIndex(list(cams).index(self.selected_cam))
+        combo.blockSignals(False)
+        self._ui_state()
+
+    def _select_camera(self, i: int) -> None:
+        if i < 0 or list(self.available_cameras)[i] == self.selected_cam:
+            return
+        self.selected_cam = list(self.available_cameras)[i]
+        self._open_camera()
+
+    def _open_camera(self, cap: cv2.VideoCapture | None = None) -> bool:
+        """Switch to the selected camera, or to *cap* if it's already open."""
         self._cleanup_all()
         cam_idx = self.selected_cam
-        log.info(f"Attempting to open webcam index {cam_idx}...")
-        # Try DSHOW first
-        self.cap = cv2.VideoCapture(cam_idx, cv2.CAP_DSHOW)
+        if cap is None:
+            # backend cached by probe_cameras – one open, not a retry chain
+            backend = self.available_cameras.get(cam_idx, cv2.CAP_ANY)
+            log.info("Attempting to open webcam index %s...", cam_idx)
+            cap = cv2.VideoCapture(cam_idx, backend)
+        self.cap = cap
         if not self.cap.isOpened():
-            log.warning(f"Cannot open webcam index {cam_idx} using DSHOW.")
-            # Try default backend
-            log.info(f"Retrying webcam index {cam_idx} with auto-backend...")
-            self.cap = cv2.VideoCapture(cam_idx)
-            if not self.cap.isOpened():
-                log.error(f"Cannot open webcam index {cam_idx} with any backend.")
-                QMessageBox.critical(
-                    self,
-                    "Camera Error",
-                    f"Cannot open webcam {cam_idx}. Ensure it's not in use.",
-                )
-                return False
+            log.error("Cannot open webcam index %s.", cam_idx)
+            QMessageBox.critical(
+                self,
+                "Camera Error",
+                f"Cannot open webcam {cam_idx}. Ensure it's not in use.",
+            )
+            return False
 
-        log.info(f"Webcam index {cam_idx} opened successfully.")
+        log.info("Webcam index %s opened successfully.", cam_idx)
+        # keep at most one frame queued so inference always sees the newest
+        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
         self.video_loaded = True
         self.fps = self.cap.get(cv2.CAP_PROP_FPS) or 30.0
-        self.tot_frames = int(1e9)  # effectively "unknown"
+        self.tot_frames = 0  # unknown; see _seekable
+        self._seekable = False
         self.cur_frame = 0
         ok, frame = self.cap.read()
         if ok and frame is not None:
-            self.view.show(frame)
+            self._frame_buf = self.view.show(frame)
         else:
             log.warning("Failed to read initial frame from webcam.")
             # Proceed anyway?
 
         self.transport.slider.setEnabled(False)  # no seeking in live
         self.files.load_btn.setEnabled(False)  # Disable loading video in live mode
-        self._update_time()
         self._ui_state()
         # Don't auto-start playback here, wait for user/processing
         # Start processing immediately after opening the camera
@@ -282,7 +409,7 @@ class MainWindow(QMainWindow):
         if not self.video_loaded:
             return
         self.is_playing = True
-        self.timer.start(int(1000 / (self.fps * self.speed)))
+        self._restart_clock()
         self.transport.set_playing(True)
 
     def _pause(self):
@@ -297,31 +424,69 @@ class MainWindow(QMainWindow):
         else:
             self._play()
 
+    def _restart_clock(self):
+        """Pace playback from the current frame (play / seek / speed change)."""
+        self._clock.start()
+        self._clock_origin = self.cur_frame
+        self.timer.start(0)
+
     def _tick(self):
-        ok, frame = self.cap.read() if self.cap else (False, None)
-        if not ok:
-            self._pause()
-            return
-        self.cur_frame += 1
-        self.view.show(frame, self.rotation)
-        self.transport.slider.setValue(self.cur_frame)
+        rate = self.fps * self.speed / 1000  # frames per ms
+        due = self._clock_origin + int(self._clock.elapsed() * rate)
+        behind = due - self.cur_frame
+        if behind > 0 and self.cap:
+            # fell behind: skip frames without decoding them (files only –
+            # a camera would block for every grab)
+            if not self.live_mode:
+                for _ in range(behind - 1):
+                    self.cap.grab()
+            ok, frame = self.cap.read(self._frame_buf)
+            if not ok:
+                self._pause()
+                return
+            self.cur_frame = due if not self.live_mode else self.cur_frame + 1
+            self._frame_buf = self.view.show(frame, self.rotation)
+            if self._seekable:
+                self.transport.slider.setValue(self.cur_frame)
+
+        # sleep until the next frame is due
+        next_ms = (self.cur_frame + 1 - self._clock_origin) / rate
+        self.timer.start(max(0, int(next_ms - self._clock.elapsed())))
 
     def _seek_abs(self, pos: int):  # files only
         if self.live_mode or not self.cap:
             return
-        self.cap.set(cv2.CAP_PROP_POS_FRAMES, pos)
+        self._pending_seek = pos
+        if not self._seek_timer.isActive():
+            self._flush_seek()
+
+    def _flush_seek(self):
+        if self._pending_seek is None or not self.cap:
+            return
+        pos, self._pending_seek = self._pending_seek, None
+        self._seek_timer.start(max(1, int(1000 / self.fps)))
+
+        ahead = pos - int(self.cap.get(cv2.CAP_PROP_POS_FRAMES))
+        if 0 <= ahead <= GRAB_SEEK_MAX:
+            for _ in range(ahead):  # skip without decoding to BGR
+                self.cap.grab()
+        else:
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, pos)
         self.cur_frame = pos
-        ok, frame = self.cap.read()
+        ok, frame = self.cap.read(self._frame_buf)
         if ok:
-            self.view.show(frame, self.rotation)
+            self._frame_buf = self.view.show(frame, self.rotation)
+        if self.is_playing:
+            self._restart_clock()
 
     def _seek_rel(self, delta: int):
-        self._seek_abs(max(0, self.cur_frame + delta))
+        base = self.cur_frame if self._pending_seek is None else self._pending_seek
+        self._seek_abs(max(0, base + delta))
 
     def _set_speed(self, s: float):
         self.speed = s
         if self.is_playing:
-            self.timer.start(int(1000 / (self.fps * self.speed)))
+            self._restart_clock()
 
     def _rotate(self):
         self.rotation = (self.rotation + 90) % 360
@@ -333,17 +498,21 @@ class MainWindow(QMainWindow):
         if self.thread and self.thread.isRunning():
             return
 
-        # load model
-        task = self.model_combo.currentText()
-        ckpt = _TASK2CKPT[task]
-        try:
-            from ultralytics import YOLO
+        if self._loading is not None:
+            return  # _on_model_loaded starts processing once it's ready
 
-            model_path = Path(__file__).resolve().parent.parent / "models" / ckpt
-            wrapper = YoloPose if YOLO(str(model_path)).task == "pose" else YoloGeneric
-            self.yolo_model = wrapper(ckpt)
-        except Exception as e:
-            QMessageBox.critical(self, "Model", str(e))
+        # load model – a first load (and its one-time export) can take
+        # minutes, so it runs on a pool thread and calls back here
+        task = self.model_combo.currentText()
+        key = (task, self.fp16_chk.isChecked(), self.export_chk.isChecked())
+        self.yolo_model = self._get_model(key)
+        if self.yolo_model is None:
+            self._loading = key
+            self.statusBar().showMessage(f"Loading {task} model…")
+            self._ui_state()
+            QThreadPool.globalInstance().start(
+                lambda: self.model_loaded.emit((key, self._build_model(key)))
+            )
             return
 
         # rewind file for full pass
@@ -355,29 +524,86 @@ class MainWindow(QMainWindow):
             input_path=None if self.live_mode else self.video_path,
             live_capture=self.cap if self.live_mode else None,
             rotation_angle=self.rotation,
+            batch_size=int(self.batch_combo.currentText()),
             parent=self,
         )
-        self.thread.change_pix.connect(
-            lambda pm: self.view.setPixmap(
-                pm.scaled(self.view.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            )
-        )
-        self.thread.progress.connect(self.transport.slider.setValue)
+        self.thread.set_preview_size(self.view.size())
+        self.view.resized.connect(self.thread.set_preview_size)
+        self.thread.change_frame.connect(self._on_frame, Qt.QueuedConnection)
+        if self._seekable:
+            self.thread.progress.connect(self.transport.slider.setValue)
         self.thread.finished_ok.connect(self._on_done)
         self.thread.start()
         self.files.save_btn.setEnabled(False)
         log.info("Processing started (%s)", task)
 
+    @Slot(object)
+    def _on_frame(self, img):
+        # frames arriving faster than we paint replace each other instead of
+        # queueing up; one flush per event-loop pass shows the newest
+        self._pending_img = img
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            QTimer.singleShot(0, self._flush_frame)
+
+    def _flush_frame(self):
+        self._flush_scheduled = False
+        img, self._pending_img = self._pending_img, None
+        if img is not None:
+            self.view.show_image(img)
+
+    @staticmethod
+    def _build_model(key: tuple) -> YoloPose | YoloGeneric | Exception:
+        """Load the wrapper for *key* – runs on a pool thread, never raises."""
+        task, half, export = key
+        wrapper = YoloPose if task == "Pose" else YoloGeneric
+        try:
+            return wrapper(_TASK2CKPT[task], half=half, export=export)
+        except Exception as e:
+            log.exception("Loading %s model failed", task)
+            return e
+
+    @Slot(object)
+    def _on_model_loaded(self, result: tuple) -> None:
+        key, model = result
+        self._loading = None
+        self.statusBar().clearMessage()
+        self._ui_state()
+        if isinstance(model, Exception):
+            QMessageBox.critical(self, "Model", str(model))
+            return
+        self._cache_model(key, model)
+        if self.video_loaded:  # the source may have gone while loading
+            self._start_processing()
+
+    def _get_model(self, key: tuple) -> YoloPose | YoloGeneric | None:
+        """Cached wrapper for (task, fp16, export), or None if not loaded."""
+        model = self._model_cache.get(key)
+        if model is not None:
+            self._model_cache.move_to_end(key)  # most recently used last
+        return model
+
+    def _cache_model(self, key: tuple, model: YoloPose | YoloGeneric) -> None:
+        """Keep *model*, evicting the least recently used beyond the limit."""
+        self._model_cache[key] = model  # most recently used last
+
+        limit = MODEL_CACHE_SIZE if self.files.cache_chk.isChecked() else 1
+        while len(self._model_cache) > limit:
+            _, old = self._model_cache.popitem(last=False)
+            # wrappers whose settings resolve alike (e.g. FP16 on CPU) share
+            # one YOLO object – keep it while any remaining entry uses it
+            if all(m.model is not old.model for m in self._model_cache.values()):
+                log.info("Unloading model %s", old.ckpt)
+                unload_model(old.model)
+
     @Slot(str)
     def _on_done(self, msg: str):
         log.info(msg)
-        self.files.save_btn.setEnabled(
-            bool(self.thread and self.thread.processed_frames)
-        )
+        self.files.save_btn.setEnabled(bool(self.thread and self.thread.frames_written))
 
     # ───────────────────────────── saving ────────────────────────────────
     def _save_video(self, name: str):
-        if not (self.thread and self.thread.processed_frames):
+        if not (self.thread and self.thread.frames_written):
             QMessageBox.information(self, "Save", "Run processing first")
             return
         out = QFileDialog.getSaveFileName(
@@ -409,61 +635,75 @@ class MainWindow(QMainWindow):
 
     # ───────────────────────── housekeeping ─────────────────────────────
     def _ui_state(self):
-        processing = self.thread and self.thread.isRunning()
-        # Enable camera combo only in live mode AND when not processing
-        self.files.camera_combo.setEnabled(
-            self.live_mode and not processing and bool(self.available_cameras)
-        )
-
+        running = bool(self.thread and self.thread.isRunning())
+        # a model load counts: its settings must not change under it
+        processing = running or self._loading is not None
         play_en = self.video_loaded and not processing
-        # Disable transport controls if in live mode and processing
         # Allow play/pause if live mode and *not* processing (for preview)
         live_preview_mode = self.live_mode and not processing
-
-        self.transport.play_btn.setEnabled(play_en or live_preview_mode)
-        # Seek/skip buttons always disabled in live mode
-        self.transport.slider.setEnabled(play_en and not self.live_mode)
-        self.transport.prev_btn.setEnabled(play_en and not self.live_mode)
-        self.transport.next_btn.setEnabled(play_en and not self.live_mode)
-        self.transport.rew_btn.setEnabled(play_en and not self.live_mode)
-        self.transport.ff_btn.setEnabled(play_en and not self.live_mode)
-
-        # Save button only for non-live video after processing
-        self.files.save_btn.setEnabled(
-            (not self.live_mode)
-            and self.video_loaded
-            and not processing
-            and bool(self.thread and self.thread.processed_frames)
-        )
-        # Load button disabled in live mode or during processing
-        self.files.load_btn.setEnabled(not self.live_mode and not processing)
-        # Other general controls disabled during processing
-        self.model_combo.setEnabled(not processing)
-        self.files.format_combo.setEnabled(not processing)
-        self.files.out_edit.setEnabled(not processing)
-        self.transport.rot_btn.setEnabled(self.video_loaded and not processing)
-        self.transport.speed_combo.setEnabled(self.video_loaded and not processing)
-
-        # Update play button icon based on actual playback state
-        self.transport.play_btn.setIcon(
-            self.style().standardIcon(
-                QStyle.SP_MediaPause if self.is_playing else QStyle.SP_MediaPlay
-            )
-        )
+        # Seek/skip controls always disabled in live mode
+        seek_en = play_en and not self.live_mode
+        t, f = self.transport, self.files
+
+        # desired enabled state of every managed widget, applied as a diff
+        wanted = {
+            # camera combo only in live mode AND when not processing
+            f.camera_combo: (
+                self.live_mode and not processing and bool(self.available_cameras)
+            ),
+            t.play_btn: play_en or live_preview_mode,
+            t.slider: seek_en,
+            t.prev_btn: seek_en,
+            t.next_btn: seek_en,
+            t.rew_btn: seek_en,
+            t.ff_btn: seek_en,
+            # Save button only for non-live video after processing
+            f.save_btn: (
+                (not self.live_mode)
+                and self.video_loaded
+                and not processing
+                and bool(self.thread and self.thread.frames_written)
+            ),
+            # Load button disabled in live mode or during processing
+            f.load_btn: not self.live_mode and not processing,
+            # Other general controls disabled during processing
+            self.model_combo: not processing,
+            self.batch_combo: not processing,
+            self.fp16_chk: not processing,
+            self.export_chk: not processing,
+            f.format_combo: not processing,
+            f.out_edit: not processing,
+            t.rot_btn: self.video_loaded and not processing,
+            t.speed_combo: self.video_loaded and not processing,
+        }
+        for widget, enabled in wanted.items():
+            if widget.isEnabled() != enabled:
+                widget.setEnabled(enabled)
+
+        # Update play button based on actual playback state (only on change)
+        if t.is_playing() != self.is_playing:
+            t.set_playing(self.is_playing)
 
     def _cleanup_all(self):
         self.timer.stop()
         self.is_playing = False
         if self.thread and self.thread.isRunning():
-            log.info("Requesting processing thread interruption...")
-            self.thread.requestInterruption()
-            if not self.thread.wait(3000):  # Wait max 3 seconds
-                log.warning("Processing thread did not finish gracefully. Terminating.")
-                self.thread.terminate()  # Force termination if wait fails
-                self.thread.wait()  # Wait again after terminate
-            else:
-                log.info("Processing thread finished.")
+            log.info("Stopping processing thread...")
+            # stages drop queued work on stop(), so this waits for at most
+            # the forward pass in progress – and the capture gets released.
+            # Nothing below may run while the thread is alive: its stages
+            # still read the capture and write the spool file
+            self.thread.stop()
+            if not self.thread.wait(THREAD_STOP_MS):
+                log.warning(
+                    "Processing thread still running after %d ms, waiting",
+                    THREAD_STOP_MS,
+                )
+                self.thread.wait()
+            log.info("Processing thread finished.")
 
+        if self.thread:
+            self.thread.discard_output()
         self.thread = None
         if self.cap:
             log.info("Releasing video capture...")
@@ -474,6 +714,7 @@ class MainWindow(QMainWindow):
 
     def closeEvent(self, e: QCloseEvent):
         self._cleanup_all()
+        self.view.shutdown()
         e.accept()
 
     # drag-n-drop ---------------------------------------------------------
@@ -3,21 +3,80 @@
 #  gui/splash_screen.py – Stride Studio splash screen
 # ---------------------------------------------------------------------------
 
-from PySide6.QtCore import Qt, QTimer, QSize
-from PySide6.QtGui import QPixmap, QPainter, QColor, QLinearGradient, QFont
-from PySide6.QtWidgets import QSplashScreen
+from PySide6.QtCore import (
+    Qt,
+    QTimer,
+    QSize,
+    QRectF,
+    QStandardPaths,
+    QElapsedTimer,
+    Slot,
+)
+from PySide6.QtGui import (
+    QPixmap,
+    QPainter,
+    QColor,
+    QLinearGradient,
+    QFont,
+    QGuiApplication,
+)
+from PySide6.QtWidgets import QSplashScreen, QProgressBar
 import os
+import zlib
+
+SPLASH_IMAGE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)), "Splash_Image.png"
+)
+
+# footer baked into the cached base image; bump _RENDER_VERSION whenever
+# create_splash_base draws differently – both are part of the cache name
+VERSION_TEXT = "v1.0.0"
+COPYRIGHT_TEXT = "\xa9 2025 Alfredo Sandoval"
+_RENDER_VERSION = 1
+
+# progress animation: 20 Hz repaints of a 0→100 % ramp over RAMP_MS
+TICK_MS = 50
+RAMP_MS = 3500
+
+# fill matching _draw_bar_fill; the track itself is baked into the base image
+_BAR_QSS = """
+QProgressBar { background: transparent; border: none; }
+QProgressBar::chunk {
+    border-radius: 4px;
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                                stop:0 rgb(0, 210, 255), stop:1 rgb(120, 80, 255));
+}
+"""
+
+
+def _bar_rect(size: QSize) -> QRectF:
+    """Loading-bar rectangle for a splash pixmap of *size*."""
+    bar_width = size.width() * 0.8
+    bar_height = 8
+    bar_x = (size.width() - bar_width) / 2
+    bar_y = size.height() * 0.9  # Position closer to bottom
+    return QRectF(bar_x, bar_y, bar_width, bar_height)
 
 
-def create_splash_pixmap(size=QSize(720, 480)):
+def _draw_bar_fill(painter: QPainter, bar: QRectF, fraction: float):
+    """Gradient fill covering *fraction* (0-1) of the loading bar."""
+    fill_gradient = QLinearGradient(bar.left(), 0, bar.right(), 0)
+    fill_gradient.setColorAt(0, QColor(0, 210, 255))
+    fill_gradient.setColorAt(1, QColor(120, 80, 255))
+
+    painter.setPen(Qt.NoPen)
+    painter.setBrush(fill_gradient)
+    fill = QRectF(bar.left(), bar.top(), bar.width() * fraction, bar.height())
+    painter.drawRoundedRect(fill, 4, 4)
+
+
+def create_splash_base(size=QSize(720, 480)):
     """
-    Create splash screen pixmap using Splash_Image.png and resize it to a reasonable size
+    Splash_Image.png scaled to *size* with the footer and an empty loading
+    bar – everything except the bar's fill, which is animated on top.
     """
     # Load the splash image from file
-    splash_image_path = os.path.join(
-        os.path.dirname(os.path.dirname(__file__)), "Splash_Image.png"
-    )
-    original_pixmap = QPixmap(splash_image_path)
+    original_pixmap = QPixmap(SPLASH_IMAGE_PATH)
 
     # Downscale the image to a reasonable size
     pixmap = original_pixmap.scaled(size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
@@ -27,24 +86,10 @@ def create_splash_pixmap(size=QSize(720, 480)):
     painter.setRenderHint(QPainter.Antialiasing)
     painter.setRenderHint(QPainter.TextAntialiasing)
 
-    # Add a loading bar at the bottom of the image
-    bar_width = pixmap.width() * 0.8
-    bar_height = 8
-    bar_x = (pixmap.width() - bar_width) / 2
-    bar_y = pixmap.height() * 0.9  # Position closer to bottom
-
     # Bar background - semi-transparent
     painter.setPen(Qt.NoPen)
     painter.setBrush(QColor(30, 30, 40, 120))
-    painter.drawRoundedRect(bar_x, bar_y, bar_width, bar_height, 4, 4)
-
-    # Bar fill gradient - this will be fully filled initially
-    fill_gradient = QLinearGradient(bar_x, 0, bar_x + bar_width, 0)
-    fill_gradient.setColorAt(0, QColor(0, 210, 255))
-    fill_gradient.setColorAt(1, QColor(120, 80, 255))
-
-    painter.setBrush(fill_gradient)
-    painter.drawRoundedRect(bar_x, bar_y, bar_width, bar_height, 4, 4)
+    painter.drawRoundedRect(_bar_rect(pixmap.size()), 4, 4)
 
     # Add version and author information
     footer_font = QFont("Arial", 10)
@@ -58,80 +103,122 @@ def create_splash_pixmap(size=QSize(720, 480)):
         pixmap.width(),
         30,
         Qt.AlignRight | Qt.AlignVCenter,
-        "v1.0.0  ",
+        f"{VERSION_TEXT}  ",
     )
 
     # Author name in center with copyright symbol
     painter.setPen(QColor(255, 255, 255, 180))
-    copyright_text = "\xa9 2025 Alfredo Sandoval"
     painter.drawText(
         0,
         pixmap.height() - 30,
         pixmap.width(),
         30,
         Qt.AlignHCenter | Qt.AlignVCenter,
-        copyright_text,
+        COPYRIGHT_TEXT,
     )
 
     painter.end()
     return pixmap
 
 
+def create_splash_pixmap(size=QSize(720, 480)):
+    """
+    Create splash screen pixmap using Splash_Image.png and resize it to a reasonable size
+    """
+    pixmap = create_splash_base(size)
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.Antialiasing)
+    _draw_bar_fill(painter, _bar_rect(pixmap.size()), 1.0)
+    painter.end()
+    return pixmap
+
+
+def _splash_cache_path(size: QSize) -> str:
+    """Per-size / per-DPI / per-footer location of the pre-rendered splash image."""
+    app = QGuiApplication.instance()
+    dpr = app.devicePixelRatio() if app else 1.0
+    cache_dir = os.path.join(
+        QStandardPaths.writableLocation(QStandardPaths.GenericCacheLocation),
+        "stride_studio",
+    )
+    render = f"{_RENDER_VERSION}|{VERSION_TEXT}|{COPYRIGHT_TEXT}".encode()
+    tag = f"{zlib.crc32(render):08x}"
+    return os.path.join(
+        cache_dir, f"splash_base_{tag}_{size.width()}x{size.height()}@{dpr:g}x.png"
+    )
+
+
+def load_splash_pixmap(size=QSize(720, 480)):
+    """
+    Return the splash base pixmap (see :func:`create_splash_base`), rendering
+    it only when the on-disk copy is missing or older than Splash_Image.png
+    or this module (which draws the footer baked into it).
+    """
+    cache_path = _splash_cache_path(size)
+    try:
+        source = max(os.path.getmtime(SPLASH_IMAGE_PATH), os.path.getmtime(__file__))
+        fresh = os.path.getmtime(cache_path) > source
+    except OSError:
+        fresh = False
+    if fresh:
+        pixmap = QPixmap(cache_path)
+        if not pixmap.isNull():
+            return pixmap
+
+    pixmap = create_splash_base(size)
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        pixmap.save(cache_path, "PNG")
+    except OSError:
+        pass  # read-only cache dir – just render every time
+    return pixmap
+
+
 class StrideStudioSplash(QSplashScreen):
     """
     Animated splash screen for Stride Studio
     """
 
     def __init__(self, app=None):
-        self.pixmap = create_splash_pixmap()
+        self.pixmap = load_splash_pixmap()
         super().__init__(self.pixmap)
         self.setWindowFlag(Qt.WindowStaysOnTopHint)
         self.app = app
 
-        # Setup animation
+        # child widget over the baked-in track: a tick repaints just the
+        # bar's rect instead of re-uploading the whole splash pixmap
+        self._bar = QProgressBar(self)
+        self._bar.setGeometry(_bar_rect(self.pixmap.size()).toAlignedRect())
+        self._bar.setRange(0, 100)
+        self._bar.setValue(0)
+        self._bar.setTextVisible(False)
+        self._bar.setStyleSheet(_BAR_QSS)
+
+        # Setup animation – the event loop repaints us, no processEvents()
         self.progress = 0
+        self._clock = QElapsedTimer()
+        self._clock.start()
         self.timer = QTimer(self)
         self.timer.timeout.connect(self._update_progress)
-        self.timer.start(35)  # update every 35ms
+        self.timer.start(TICK_MS)
 
     def _update_progress(self):
-        """Animate the progress bar"""
-        self.progress += 1
-        if self.progress > 100:
-            self.timer.stop()
-            return
+        """Animate the progress bar along the wall-clock ramp"""
+        self._show_progress(min(100, self._clock.elapsed() * 100 // RAMP_MS))
+
+    @Slot(int)
+    def set_progress(self, value: int):
+        """Drive the bar from real start-up milestones instead of the ramp"""
+        self.timer.stop()
+        self._show_progress(max(0, min(100, value)))
 
-        # Redraw the pixmap with updated progress bar
-        size = self.pixmap.size()
-        painter = QPainter(self.pixmap)
-
-        # Bar dimensions
-        bar_width = size.width() * 0.8
-        bar_height = 8
-        bar_x = (size.width() - bar_width) / 2
-        bar_y = size.height() * 0.9  # Position closer to bottom
-
-        # Clear previous progress
-        painter.setPen(Qt.NoPen)
-        painter.setBrush(QColor(30, 30, 40, 120))
-        painter.drawRoundedRect(bar_x, bar_y, bar_width, bar_height, 4, 4)
-
-        # Draw updated progress
-        fill_gradient = QLinearGradient(bar_x, 0, bar_x + bar_width, 0)
-        fill_gradient.setColorAt(0, QColor(0, 210, 255))
-        fill_gradient.setColorAt(1, QColor(120, 80, 255))
-
-        painter.setBrush(fill_gradient)
-        progress_width = bar_width * (self.progress / 100.0)
-        painter.drawRoundedRect(bar_x, bar_y, progress_width, bar_height, 4, 4)
-
-        # If we have an application, process its events to keep UI responsive
-        if self.app:
-            self.app.processEvents()
-
-        # Update splash screen with new pixmap
-        self.setPixmap(self.pixmap)
-        painter.end()
+    def _show_progress(self, value: int):
+        if value == self.progress:
+            return
+        self.progress = value
+        if value >= 100:
+            self.timer.stop()
+        self._bar.setValue(value)
 
     def show_and_finish(self, main_window, duration=2500):
         """Show splash screen and close it after window is loaded"""
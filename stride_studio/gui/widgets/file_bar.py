@@ -9,13 +9,14 @@ from PySide6.QtWidgets import (
     QFileDialog,
     QStyle,
     QComboBox,
+    QCheckBox,
 )
 
 
 class FileBar(QWidget):
     """Load/Save controls."""
 
-    open_video = Signal()
+    open_video = Signal(str)  # Emits the chosen video path
     save_video = Signal(str)  # Emits desired filename prefix
 
     def __init__(self, parent: QWidget | None = None):
@@ -25,9 +26,15 @@ class FileBar(QWidget):
 
         self.load_btn = QPushButton("Load Video")
         self.load_btn.setIcon(self.style().standardIcon(QStyle.SP_DialogOpenButton))
-        self.load_btn.clicked.connect(self.open_video)
+        self.load_btn.clicked.connect(self._choose_file)
         self.load_btn.setMinimumWidth(120)
         layout.addWidget(self.load_btn)
+
+        # live mode only (MainWindow shows it and fills in probed cameras)
+        self.camera_combo = QComboBox()
+        self.camera_combo.setMinimumWidth(110)
+        self.camera_combo.setVisible(False)
+        layout.addWidget(self.camera_combo)
         layout.addSpacing(10)
 
         save_box = QHBoxLayout()  # Inner layout for save button + edit
@@ -55,6 +62,12 @@ class FileBar(QWidget):
         save_wrap.setLayout(save_box)
         layout.addWidget(save_wrap)
 
+        layout.addSpacing(10)
+        self.cache_chk = QCheckBox("Keep models loaded")
+        self.cache_chk.setChecked(True)
+        self.cache_chk.setToolTip("Switch back to a recent model without reloading it")
+        layout.addWidget(self.cache_chk)
+
     # ------------------------------------------------------------------
     def _choose_file(self):
         path, _ = QFileDialog.getOpenFileName(
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, QTimer, Signal
 from PySide6.QtWidgets import (
     QWidget,
     QHBoxLayout,
@@ -10,6 +10,11 @@ from PySide6.QtWidgets import (
     QStyle,
 )
 
+# scrubbing emits a seek once the handle has rested this long
+SEEK_DEBOUNCE_MS = 50
+# playback rates offered by the speed box, in item order
+_SPEEDS = (0.25, 0.5, 0.75, 1.0, 1.25, 1.5, 2.0)
+
 
 class TransportBar(QWidget):
     """Play / seek / speed / rotate bar."""
@@ -28,52 +33,93 @@ class TransportBar(QWidget):
         lay = QHBoxLayout(self)
         lay.setSpacing(8)
 
+        # every icon the bar uses, rendered once (play/pause swap on toggle)
+        style = self.style()
+        self._icons = {
+            sp: style.standardIcon(sp)
+            for sp in (
+                QStyle.SP_MediaSkipBackward,
+                QStyle.SP_MediaSeekBackward,
+                QStyle.SP_MediaPlay,
+                QStyle.SP_MediaPause,
+                QStyle.SP_MediaSeekForward,
+                QStyle.SP_MediaSkipForward,
+                QStyle.SP_BrowserReload,
+            )
+        }
+
         def _btn(icon: QStyle.StandardPixmap, sig: Signal):
             b = QPushButton()
-            b.setIcon(self.style().standardIcon(icon))
+            b.setIcon(self._icons[icon])
             b.setFixedWidth(34)
             b.clicked.connect(sig)  # type: ignore[arg-type]
             lay.addWidget(b)
             return b
 
-        _btn(QStyle.SP_MediaSkipBackward, self.prev)
-        _btn(QStyle.SP_MediaSeekBackward, self.prev)
+        self.rew_btn = _btn(QStyle.SP_MediaSkipBackward, self.prev)
+        self.prev_btn = _btn(QStyle.SP_MediaSeekBackward, self.prev)
 
-        self._play = QPushButton("Play")
-        self._play.setIcon(self.style().standardIcon(QStyle.SP_MediaPlay))
-        self._play.setMinimumWidth(90)
-        self._play.clicked.connect(self._toggle)
-        lay.addWidget(self._play)
+        self.play_btn = QPushButton("Play")
+        self.play_btn.setIcon(self._icons[QStyle.SP_MediaPlay])
+        self.play_btn.setMinimumWidth(90)
+        self.play_btn.clicked.connect(self._toggle)
+        lay.addWidget(self.play_btn)
 
-        _btn(QStyle.SP_MediaSeekForward, self.next)
-        _btn(QStyle.SP_MediaSkipForward, self.next)
+        self.next_btn = _btn(QStyle.SP_MediaSeekForward, self.next)
+        self.ff_btn = _btn(QStyle.SP_MediaSkipForward, self.next)
 
         self.slider = QSlider(Qt.Horizontal)
-        self.slider.sliderReleased.connect(lambda: self.seek.emit(self.slider.value()))
+        self._seek_timer = QTimer(self)
+        self._seek_timer.setSingleShot(True)
+        self._seek_timer.setInterval(SEEK_DEBOUNCE_MS)
+        self._seek_timer.timeout.connect(self._flush_seek)
+        self._last_seek: int | None = None  # emitted during the current drag
+        self.slider.sliderPressed.connect(self._begin_scrub)
+        self.slider.sliderMoved.connect(self._queue_seek)
+        self.slider.sliderReleased.connect(self._flush_seek)
         lay.addWidget(self.slider, 1)
 
         lay.addWidget(QLabel("Speed:"))
-        self.speed_box = QComboBox()
-        self.speed_box.addItems(
-            ["0.25x", "0.5x", "0.75x", "1.0x", "1.25x", "1.5x", "2.0x"]
-        )
-        self.speed_box.setCurrentIndex(3)
-        self.speed_box.currentTextChanged.connect(
-            lambda t: self.speed.emit(float(t.rstrip("x")))
-        )
-        self.speed_box.setFixedWidth(72)
-        lay.addWidget(self.speed_box)
-
-        self._rot = QPushButton("Rotate")
-        self._rot.setIcon(self.style().standardIcon(QStyle.SP_BrowserReload))
-        self._rot.clicked.connect(self.rotate)  # type: ignore[arg-type]
-        lay.addWidget(self._rot)
+        self.speed_combo = QComboBox()
+        self.speed_combo.addItems([f"{s}x" for s in _SPEEDS])
+        self.speed_combo.setCurrentIndex(_SPEEDS.index(1.0))
+        self.speed_combo.currentIndexChanged.connect(self._on_speed_changed)
+        self.speed_combo.setFixedWidth(72)
+        lay.addWidget(self.speed_combo)
+
+        self.rot_btn = QPushButton("Rotate")
+        self.rot_btn.setIcon(self._icons[QStyle.SP_BrowserReload])
+        self.rot_btn.clicked.connect(self.rotate)  # type: ignore[arg-type]
+        lay.addWidget(self.rot_btn)
 
     # ------------------------------------------------------------------ helpers
+    def is_playing(self) -> bool:
+        """Whether the play button currently shows the playing state."""
+        return self.play_btn.text() == "Pause"
+
     def set_playing(self, playing: bool):
         icon = QStyle.SP_MediaPause if playing else QStyle.SP_MediaPlay
-        self._play.setIcon(self.style().standardIcon(icon))
-        self._play.setText("Pause" if playing else "Play")
+        self.play_btn.setIcon(self._icons[icon])
+        self.play_btn.setText("Pause" if playing else "Play")
+
+    def _begin_scrub(self):
+        self._last_seek = None  # playback may have moved the handle since
+
+    def _queue_seek(self, _value: int):
+        self._seek_timer.start()  # restarts: only the resting position seeks
+
+    def _flush_seek(self):
+        self._seek_timer.stop()
+        value = self.slider.value()
+        if value == self._last_seek:
+            return  # the debounce already sought here; release adds nothing
+        self._last_seek = value
+        self.seek.emit(value)
+
+    def _on_speed_changed(self, i: int):
+        if i < 0:  # combo cleared
+            return
+        self.speed.emit(_SPEEDS[i])
 
     def _toggle(self):
-        (self.pause if self._play.text() == "Pause" else self.play).emit()
+        (self.pause if self.is_playing() else self.play).emit()
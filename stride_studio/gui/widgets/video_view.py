@@ -1,37 +1,222 @@
 from __future__ import annotations
 import cv2, numpy as np
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QCoreApplication, QObject, QThread, Qt, QSize, Signal, Slot
 from PySide6.QtGui import QImage, QPixmap
 from PySide6.QtWidgets import QLabel
 
+# decode buffers VideoView keeps for reuse once the worker is done with them
+SPARE_BUFFERS = 2
+
+
+class FrameWorker(QObject):
+    """
+    Rotates / scales BGR frames to display size off the GUI thread.
+
+    Lives on :class:`VideoView`'s render thread; one :meth:`render` call at a
+    time. The result is written into a persistent RGB32 QImage – emitting it
+    shares the buffer, and the next write detaches only if the GUI thread is
+    still holding the previous frame.
+    """
+
+    # display image, and the source frame (handed back for reuse)
+    frame_ready = Signal(QImage, object)
+
+    def __init__(self):
+        super().__init__()
+        # (source w, h, label w, h) → aspect-fit display size
+        self._fit_key: tuple[int, int, int, int] | None = None
+        self._fit: tuple[int, int] = (0, 0)
+        # display-sized buffers, reused until the fit size changes: the
+        # RGB32 QImage Qt blits natively, and BGR scratch for resize / warp
+        self._qimg: QImage | None = None
+        self._scaled: np.ndarray | None = None
+        # (src w, h, angle, dst w, h) → rotate+scale matrix for warpAffine
+        self._warp_key: tuple | None = None
+        self._warp_m: np.ndarray | None = None
+
+    @Slot(object, int, QSize)
+    def render(self, frame_bgr: np.ndarray, rotate: int, size: QSize):
+        # scale (and rotate) in cv2 into persistent buffers, so Qt only ever
+        # sees display-sized pixels and nothing is allocated per frame
+        h, w = frame_bgr.shape[:2]
+        tw, th = self._fit_size(*((h, w) if rotate in (90, 270) else (w, h)), size)
+        if self._scaled is None or self._scaled.shape[:2] != (th, tw):
+            self._scaled = np.empty((th, tw, 3), np.uint8)
+        dst = self._scaled
+        if rotate:
+            # one pass for rotate + scale instead of cv2.rotate then resize
+            cv2.warpAffine(
+                frame_bgr,
+                self._warp_matrix(w, h, rotate, tw, th),
+                (tw, th),
+                dst=dst,
+                flags=cv2.INTER_LINEAR,
+                borderMode=cv2.BORDER_REPLICATE,
+            )
+        elif (tw, th) != (w, h):
+            interp = cv2.INTER_AREA if tw < w else cv2.INTER_LINEAR
+            cv2.resize(frame_bgr, (tw, th), dst=dst, interpolation=interp)
+        else:
+            dst = frame_bgr
+        # BGR888 would be expanded to 32 bpp inside fromImage anyway; doing
+        # it here into a native RGB32 image makes the upload a plain copy
+        cv2.cvtColor(dst, cv2.COLOR_BGR2BGRA, dst=self._buf_view(tw, th))
+        self.frame_ready.emit(self._qimg, frame_bgr)
+
+    def _fit_size(self, w: int, h: int, size: QSize) -> tuple[int, int]:
+        """Aspect-preserving size of a *w*×*h* frame inside *size*."""
+        key = (w, h, size.width(), size.height())
+        if self._fit_key != key:
+            fit = QSize(w, h).scaled(size, Qt.KeepAspectRatio)
+            self._fit = (max(1, fit.width()), max(1, fit.height()))
+            self._fit_key = key
+        return self._fit
+
+    def _warp_matrix(self, w: int, h: int, rotate: int, tw: int, th: int):
+        """
+        Affine map of a *w*×*h* frame rotated *rotate*° clockwise and scaled
+        to *tw*×*th*, in pixel-centre coordinates (exact at 1:1).
+        """
+        key = (w, h, rotate, tw, th)
+        if self._warp_key != key:
+            if rotate == 90:
+                sx, sy = tw / h, th / w
+                m = [[0, -sx, sx * (h - 0.5) - 0.5], [sy, 0, 0.5 * sy - 0.5]]
+            elif rotate == 270:
+                sx, sy = tw / h, th / w
+                m = [[0, sx, 0.5 * sx - 0.5], [-sy, 0, sy * (w - 0.5) - 0.5]]
+            else:  # 180
+                sx, sy = tw / w, th / h
+                m = [[-sx, 0, sx * (w - 0.5) - 0.5], [0, -sy, sy * (h - 0.5) - 0.5]]
+            self._warp_m = np.array(m, np.float64)
+            self._warp_key = key
+        return self._warp_m
+
+    def _buf_view(self, w: int, h: int) -> np.ndarray:
+        """(h, w, 4) BGRA view of the RGB32 frame QImage, reallocated on resize."""
+        if self._qimg is None or (self._qimg.width(), self._qimg.height()) != (w, h):
+            self._qimg = QImage(w, h, QImage.Format_RGB32)
+        rows = np.frombuffer(self._qimg.bits(), np.uint8).reshape(
+            h, self._qimg.bytesPerLine()
+        )
+        return rows[:, : 4 * w].reshape(h, w, 4)
+
 
 class VideoView(QLabel):
     """QLabel that can display raw BGR numpy frames."""
 
+    resized = Signal(QSize)  # lets producers render previews at display size
+    _render = Signal(object, int, QSize)  # → FrameWorker.render
+
     def __init__(self, text: str = "No video"):
         super().__init__(text, alignment=Qt.AlignCenter)
         self.setScaledContents(False)
+        # newest frame that arrived while hidden; painted by showEvent
+        self._stale: tuple | None = None
+
+        # rotate / scale / convert run on a worker; the GUI thread only
+        # uploads the finished display-sized image
+        self._worker = FrameWorker()
+        self._worker_thread = QThread(self)
+        self._worker.moveToThread(self._worker_thread)
+        self._render.connect(self._worker.render)
+        self._worker.frame_ready.connect(self._on_rendered)
+        self._worker_thread.start()
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.shutdown)
+        self._busy = False  # a frame is with the worker
+        self._queued: tuple | None = None  # newest frame waiting for it
+        self._spare: list[np.ndarray] = []  # returned frames, for reuse
+        self._epoch = 0  # bumped by clear(): drops renders still in flight
+        self._sent_epoch = 0
 
     # ------------------------------------------------------------------ api
-    def show(self, frame_bgr: np.ndarray, rotate: int = 0):
+    def show(self, frame_bgr: np.ndarray, rotate: int = 0) -> np.ndarray | None:
+        """
+        Display *frame_bgr*, rotated *rotate*° clockwise.
+
+        The frame is rendered asynchronously, so the view takes ownership of
+        it: the caller must not write to it again. Returns a buffer the
+        caller may decode the next frame into (``cap.read(buf)``), or None.
+        """
         if frame_bgr is None or frame_bgr.size == 0:
+            return frame_bgr
+        if not self._can_paint():
+            self._stale = (self.show, frame_bgr, rotate)
+        elif self._busy:
+            # worker still on the previous frame: only the newest waits
+            if self._queued is not None:
+                self._recycle(self._queued[0])
+            self._queued = (frame_bgr, rotate)
+        else:
+            self._submit(frame_bgr, rotate)
+        return self._spare.pop() if self._spare else None
+
+    def _submit(self, frame_bgr: np.ndarray, rotate: int):
+        self._busy = True
+        self._sent_epoch = self._epoch
+        self._render.emit(frame_bgr, rotate, self.size())
+
+    def _recycle(self, buf: np.ndarray):
+        if len(self._spare) < SPARE_BUFFERS:
+            self._spare.append(buf)
+
+    @Slot(QImage, object)
+    def _on_rendered(self, img: QImage, frame_bgr: np.ndarray):
+        self._busy = False
+        self._recycle(frame_bgr)
+        if self._queued is not None:
+            self._submit(*self._queued)
+            self._queued = None
+        if self._sent_epoch == self._epoch:
+            self.show_image(img)
+
+    def shutdown(self):
+        """Stop the render thread (idempotent; also run on aboutToQuit)."""
+        if self._worker_thread.isRunning():
+            self._worker_thread.quit()
+            self._worker_thread.wait()
+
+    def show_image(self, img: QImage):
+        """
+        Display a worker-thread preview frame.
+
+        The worker already downscales to the label size (see ``resized``), so
+        usually this is a plain upload; otherwise a cheap nearest-neighbour
+        fit covers the frames in flight while the window is being resized.
+        """
+        if img.isNull():
             return
-        if rotate:
-            frame_bgr = cv2.rotate(
-                frame_bgr,
-                {
-                    90: cv2.ROTATE_90_CLOCKWISE,
-                    180: cv2.ROTATE_180,
-                    270: cv2.ROTATE_90_COUNTERCLOCKWISE,
-                }[rotate],
-            )
-        h, w, c = frame_bgr.shape
-        qimg = QImage(frame_bgr.data, w, h, c * w, QImage.Format_BGR888)
-        pm = QPixmap.fromImage(qimg)
-        self.setPixmap(
-            pm.scaled(self.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        if not self._can_paint():
+            self._stale = (self.show_image, img)
+            return
+        if img.size().scaled(self.size(), Qt.KeepAspectRatio) != img.size():
+            img = img.scaled(self.size(), Qt.KeepAspectRatio, Qt.FastTransformation)
+        self.setPixmap(QPixmap.fromImage(img))
+
+    def _can_paint(self) -> bool:
+        """False while the frame couldn't be seen (hidden, minimised, 0×0)."""
+        return (
+            self.isVisible()
+            and not self.size().isEmpty()
+            and not self.window().isMinimized()
         )
 
+    def showEvent(self, e):
+        super().showEvent(e)
+        if self._stale is not None:
+            paint, *args = self._stale
+            self._stale = None
+            paint(*args)
+
+    def resizeEvent(self, e):
+        super().resizeEvent(e)
+        self.resized.emit(e.size())
+
     def clear(self, text="No video"):
+        self._stale = None
+        self._queued = None
+        self._epoch += 1
         self.setText(text)
         self.setPixmap(QPixmap())
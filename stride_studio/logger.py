@@ -8,6 +8,9 @@ Package-wide logger initialisation.
 Features
 --------
 * Rotating **file** handler (`~/.stride_studio/stride_studio.log`, 10 MiB × 5)
+* File / console I/O on a background :class:`QueueListener` thread – a log
+  call from the GUI thread only costs a queue put
+* Buffered log file, flushed every ~200 ms (and on exit) instead of per record
 * Coloured **console** output on TTYs (falls back to plain text otherwise)
 * Dynamic level change via :func:`set_level`
 * Automatic capture of uncaught exceptions (main thread)
@@ -15,9 +18,13 @@ Features
 
 from __future__ import annotations
 
+import atexit
 import logging
+import os
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 from typing import Final
 
@@ -29,11 +36,20 @@ LOG_DIR: Final[Path] = Path.home() / ".stride_studio"
 LOG_DIR.mkdir(exist_ok=True)
 LOG_PATH: Final[Path] = LOG_DIR / "stride_studio.log"
 
+# file writes are batched: at most this long / this much data stays unflushed
+FLUSH_INTERVAL_S: Final[float] = 0.2
+FLUSH_BYTES: Final[int] = 64 * 1024
+
 # single package-root logger
 LOGGER: Final[logging.Logger] = logging.getLogger("stride_studio")
 
-# keep handler refs so we can tweak / remove later
+# keep handler refs so we can tweak / remove later; these are fed by the
+# listener, LOGGER itself only carries the QueueHandler
 _HANDLERS: list[logging.Handler] = []
+_LISTENER: QueueListener | None = None
+# guards the one-time handler set-up in init()
+_INIT_LOCK: Final[threading.Lock] = threading.Lock()
+_INITIALIZED = False
 
 
 # --------------------------------------------------------------------------- #
@@ -44,8 +60,83 @@ def _build_console_handler(fmt: str, date: str) -> logging.Handler:
     return hdl
 
 
+class _BufferedRotatingFileHandler(RotatingFileHandler):
+    """
+    :class:`RotatingFileHandler` that batches writes.
+
+    ``StreamHandler.emit`` flushes after every record; here that flush only
+    wakes one long-lived flusher thread, so records reach the disk in one
+    write per :data:`FLUSH_INTERVAL_S` (or whenever :data:`FLUSH_BYTES` fill
+    the buffer). ``close()`` – run by :func:`logging.shutdown` – stops the
+    flusher and writes the rest itself, starting no thread at shutdown.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._size = 0  # bytes in the current file, incl. still-buffered ones
+        self._next = 0  # length of the record being emitted
+        self._regular = True
+        self._closing = False
+        self._dirty = threading.Event()  # unflushed records in the buffer
+        self._stop = threading.Event()
+        super().__init__(*args, **kwargs)
+        self._flusher = threading.Thread(
+            target=self._flush_loop, name="stride-log-flush", daemon=True
+        )
+        self._flusher.start()
+
+    def _open(self):
+        stream = open(
+            self.baseFilename,
+            self.mode,
+            buffering=FLUSH_BYTES,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
+        st = os.fstat(stream.fileno())
+        self._size = st.st_size
+        self._regular = os.path.isfile(self.baseFilename)
+        return stream
+
+    def shouldRollover(self, record) -> bool:
+        # the base class asks the stream for tell(), which flushes the buffer
+        if self.stream is None:
+            self.stream = self._open()
+        if self.maxBytes <= 0 or not self._regular:
+            return False
+        # character count: close enough to bytes for a rotation threshold
+        self._next = len("%s\n" % self.format(record))
+        return self._size + self._next >= self.maxBytes
+
+    def emit(self, record) -> None:
+        super().emit(record)  # shouldRollover() → (doRollover()) → write
+        self._size += self._next
+        self._next = 0
+
+    def flush(self) -> None:
+        if self._closing:  # FileHandler.close() → flush: write through
+            super().flush()
+        else:
+            self._dirty.set()
+
+    def _flush_loop(self) -> None:
+        while not self._stop.is_set():
+            self._dirty.wait()
+            self._stop.wait(FLUSH_INTERVAL_S)  # let the batch build up
+            self._dirty.clear()
+            super().flush()  # takes the handler lock
+
+    def close(self) -> None:
+        self._closing = True
+        self._stop.set()
+        self._dirty.set()  # wake the flusher so it exits
+        # no join: logging.shutdown() calls this holding the handler lock,
+        # which the flusher may be waiting on; once the stream is closed its
+        # last flush() is a no-op
+        super().close()  # flushes (now direct) and closes the stream
+
+
 def _build_file_handler(fmt: str, date: str) -> logging.Handler:
-    hdl = RotatingFileHandler(
+    hdl = _BufferedRotatingFileHandler(
         LOG_PATH, maxBytes=10 * 1024 * 1024, backupCount=5, encoding="utf-8"
     )
     hdl.setFormatter(logging.Formatter(fmt, datefmt=date))
@@ -59,24 +150,30 @@ def init(level: int = logging.INFO) -> logging.Logger:
 
     Re-invocations simply update the level; they do *not* duplicate handlers.
     """
-    global _HANDLERS
+    global _HANDLERS, _LISTENER, _INITIALIZED
 
     fmt = "%(asctime)s  %(levelname)-8s  %(name)s: %(message)s"
     date = "%Y-%m-%d %H:%M:%S"
 
-    if not _HANDLERS:  # first time → create handlers
-        file_hdl = _build_file_handler(fmt, date)
-        console_hdl = _build_console_handler(fmt, date)
-        _HANDLERS.extend([file_hdl, console_hdl])
-        for h in _HANDLERS:
-            LOGGER.addHandler(h)
+    with _INIT_LOCK:  # concurrent first calls must not both build handlers
+        if not _INITIALIZED:
+            file_hdl = _build_file_handler(fmt, date)
+            console_hdl = _build_console_handler(fmt, date)
+            _HANDLERS.extend([file_hdl, console_hdl])
+
+            log_q: queue.SimpleQueue = queue.SimpleQueue()
+            LOGGER.addHandler(QueueHandler(log_q))
+            _LISTENER = QueueListener(log_q, *_HANDLERS, respect_handler_level=True)
+            _LISTENER.start()
+            atexit.register(_LISTENER.stop)  # drains the queue before exit
 
-        # intercept uncaught exceptions
-        def _ex_hook(exctype, value, tb):
-            LOGGER.critical("UNCAUGHT EXCEPTION", exc_info=(exctype, value, tb))
-            sys.__excepthook__(exctype, value, tb)
+            # intercept uncaught exceptions
+            def _ex_hook(exctype, value, tb):
+                LOGGER.critical("UNCAUGHT EXCEPTION", exc_info=(exctype, value, tb))
+                sys.__excepthook__(exctype, value, tb)
 
-        sys.excepthook = _ex_hook
+            sys.excepthook = _ex_hook
+            _INITIALIZED = True
 
     # set / update level
     LOGGER.setLevel(level)
@@ -94,7 +191,7 @@ def init(level: int = logging.INFO) -> logging.Logger:
 # --------------------------------------------------------------------------- #
 def set_level(level: int) -> None:
     """Change log level for package and all handlers at runtime."""
-    if not _HANDLERS:
+    if not _INITIALIZED:
         LOGGER.warning("Logger not initialised; calling init() implicitly.")
         init(level)
         return
@@ -19,7 +19,8 @@ Usage
 from __future__ import annotations
 
 import logging
-import os
+from functools import lru_cache
+from pathlib import Path
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QColor, QPalette, QIcon
 from PySide6.QtWidgets import QApplication
@@ -37,13 +38,142 @@ SUCCESS = QColor(46, 160, 67)  # Success green
 DANGER = QColor(248, 81, 73)  # Danger/error red
 WARNING = QColor(255, 180, 0)  # Warning/caution yellow
 
-# --------------------------------------------------------------------------- #
+# application icon – the .ico holds several sizes, so it is parsed only once
+_ICON_PATH = str(Path(__file__).resolve().parent.parent / "gui" / "icons" / "icon.ico")
+_ICON: QIcon | None = None
 
+# --------------------------------------------------------------------------- #
+# widgets stylesheet (enhanced modern look) – a constant, so re-applying the
+# theme doesn't rebuild it
+_STYLESHEET = """
+    /* Main window styling */
+    QMainWindow, QDialog {
+        background-color: #16171b;
+        color: #e1e4e8;
+    }
+    
+    /* App title styling */
+    QLabel#AppTitle {
+        font-size: 22px;
+        font-weight: bold;
+        color: #ffffff;
+        padding: 5px;
+    }
+    
+    /* Drop area with improved styling */
+    QLabel#DropArea {
+        border: 1px solid #30363d;
+        border-radius: 8px;
+        background-color: #1a1d24;
+        color: #8b949e;
+        font-size: 16px;
+        padding: 20px;
+    }
+    
+    /* Button styling with modern look */
+    QPushButton {
+        background-color: #21262d;
+        color: #c9d1d9;
+        border: 1px solid #30363d;
+        border-radius: 6px;
+        padding: 8px 16px;
+        font-weight: bold;
+        min-height: 32px;
+    }
+    QPushButton:hover {
+        background-color: #30363d;
+        border-color: #8b949e;
+        color: #ffffff;
+    }
+    QPushButton:pressed {
+        background-color: #0d419d;
+        border-color: #58a6ff;
+    }
+    QPushButton:disabled {
+        background-color: #21262d;
+        color: #484f58;
+        border: 1px solid #21262d;
+    }
+    
+    /* Slider styling for better UX */
+    QSlider::groove:horizontal {
+        border: 1px solid #30363d;
+        height: 8px;
+        background: #0d1117;
+        margin: 2px 0;
+        border-radius: 4px;
+    }
+    QSlider::handle:horizontal {
+        background: #58a6ff;
+        border: 1px solid #388bfd;
+        width: 18px;
+        height: 18px;
+        margin: -6px 0;
+        border-radius: 9px;
+    }
+    QSlider::handle:horizontal:hover {
+        background: #79b8ff;
+        border: 1px solid #79b8ff;
+    }
+    
+    /* Progress bar with solid color */
+    QProgressBar {
+        border: 1px solid #30363d;
+        border-radius: 5px;
+        background-color: #0d1117;
+        text-align: center;
+        color: white;
+        font-weight: bold;
+    }
+    QProgressBar::chunk {
+        background-color: #58a6ff;
+        border-radius: 5px;
+    }
+    
+    /* Line edit fields */
+    QLineEdit {
+        border: 1px solid #30363d;
+        border-radius: 6px;
+        padding: 5px 10px;
+        background-color: #0d1117;
+        color: #c9d1d9;
+        selection-background-color: #388bfd;
+    }
+    QLineEdit:focus {
+        border: 1px solid #58a6ff;
+    }
+    
+    /* Checkbox styling */
+    QCheckBox {
+        color: #c9d1d9;
+        spacing: 8px;
+    }
+    QCheckBox::indicator {
+        width: 18px;
+        height: 18px;
+        border-radius: 4px;
+        border: 1px solid #30363d;
+    }
+    QCheckBox::indicator:unchecked {
+        background-color: #0d1117;
+    }
+    QCheckBox::indicator:checked {
+        background-color: #388bfd;
+        image: url("data:image/svg+xml,<svg xmlns='http://www.w3.org/2000/svg' viewBox='0 0 24 24' width='24' height='24'><path fill='%23ffffff' d='M9 16.17L4.83 12l-1.42 1.41L9 19 21 7l-1.41-1.41z'/></svg>");
+    }
+    
+    /* Status bar */
+    QStatusBar {
+        background-color: #161b22;
+        color: #8b949e;
+        border-top: 1px solid #30363d;
+    }
+"""
 
-def dark_theme(app: QApplication) -> None:
-    """Apply the dark palette and enhanced button stylesheet to *app*."""
-    log.debug("Applying dark theme …")
 
+@lru_cache(maxsize=None)
+def _build_palette() -> QPalette:
+    """Dark palette, built once on first use (after the QApplication exists)."""
     pal = QPalette()
     for role, col in [
         (QPalette.Window, DARK_BG),
@@ -59,144 +189,24 @@ def dark_theme(app: QApplication) -> None:
         (QPalette.HighlightedText, Qt.black),
     ]:
         pal.setColor(role, col)
+    return pal
+
+
+def dark_theme(app: QApplication) -> None:
+    """Apply the dark palette and enhanced button stylesheet to *app*."""
+    global _ICON
+    log.debug("Applying dark theme …")
 
-    app.setPalette(pal)
+    app.setPalette(_build_palette())
     log.debug("Setting application icon from Stride Studio icon")
-    icon_path = os.path.join(
-        os.path.dirname(__file__), "..", "gui", "icons", "icon.ico"
-    )
-    app.setWindowIcon(QIcon(icon_path))
+    if _ICON is None:
+        _ICON = QIcon(_ICON_PATH)
+    app.setWindowIcon(_ICON)
     if not app.windowIcon().isNull():
-        log.debug(f"Icon set successfully from {icon_path}")
+        log.debug("Icon set successfully from %s", _ICON_PATH)
     else:
-        log.error(f"Failed to set icon from {icon_path}: file not found or invalid")
+        log.error("Failed to set icon from %s: file not found or invalid", _ICON_PATH)
 
-    # ----- widgets stylesheet (enhanced modern look) ------------------------- #
-    app.setStyleSheet(
-        """
-        /* Main window styling */
-        QMainWindow, QDialog {
-            background-color: #16171b;
-            color: #e1e4e8;
-        }
-        
-        /* App title styling */
-        QLabel#AppTitle {
-            font-size: 22px;
-            font-weight: bold;
-            color: #ffffff;
-            padding: 5px;
-        }
-        
-        /* Drop area with improved styling */
-        QLabel#DropArea {
-            border: 1px solid #30363d;
-            border-radius: 8px;
-            background-color: #1a1d24;
-            color: #8b949e;
-            font-size: 16px;
-            padding: 20px;
-        }
-        
-        /* Button styling with modern look */
-        QPushButton {
-            background-color: #21262d;
-            color: #c9d1d9;
-            border: 1px solid #30363d;
-            border-radius: 6px;
-            padding: 8px 16px;
-            font-weight: bold;
-            min-height: 32px;
-        }
-        QPushButton:hover {
-            background-color: #30363d;
-            border-color: #8b949e;
-            color: #ffffff;
-        }
-        QPushButton:pressed {
-            background-color: #0d419d;
-            border-color: #58a6ff;
-        }
-        QPushButton:disabled {
-            background-color: #21262d;
-            color: #484f58;
-            border: 1px solid #21262d;
-        }
-        
-        /* Slider styling for better UX */
-        QSlider::groove:horizontal {
-            border: 1px solid #30363d;
-            height: 8px;
-            background: #0d1117;
-            margin: 2px 0;
-            border-radius: 4px;
-        }
-        QSlider::handle:horizontal {
-            background: #58a6ff;
-            border: 1px solid #388bfd;
-            width: 18px;
-            height: 18px;
-            margin: -6px 0;
-            border-radius: 9px;
-        }
-        QSlider::handle:horizontal:hover {
-            background: #79b8ff;
-            border: 1px solid #79b8ff;
-        }
-        
-        /* Progress bar with solid color */
-        QProgressBar {
-            border: 1px solid #30363d;
-            border-radius: 5px;
-            background-color: #0d1117;
-            text-align: center;
-            color: white;
-            font-weight: bold;
-        }
-        QProgressBar::chunk {
-            background-color: #58a6ff;
-            border-radius: 5px;
-        }
-        
-        /* Line edit fields */
-        QLineEdit {
-            border: 1px solid #30363d;
-            border-radius: 6px;
-            padding: 5px 10px;
-            background-color: #0d1117;
-            color: #c9d1d9;
-            selection-background-color: #388bfd;
-        }
-        QLineEdit:focus {
-            border: 1px solid #58a6ff;
-        }
-        
-        /* Checkbox styling */
-        QCheckBox {
-            color: #c9d1d9;
-            spacing: 8px;
-        }
-        QCheckBox::indicator {
-            width: 18px;
-            height: 18px;
-            border-radius: 4px;
-            border: 1px solid #30363d;
-        }
-        QCheckBox::indicator:unchecked {
-            background-color: #0d1117;
-        }
-        QCheckBox::indicator:checked {
-            background-color: #388bfd;
-            image: url("data:image/svg+xml,<svg xmlns='http://www.w3.org/2000/svg' viewBox='0 0 24 24' width='24' height='24'><path fill='%23ffffff' d='M9 16.17L4.83 12l-1.42 1.41L9 19 21 7l-1.41-1.41z'/></svg>");
-        }
-        
-        /* Status bar */
-        QStatusBar {
-            background-color: #161b22;
-            color: #8b949e;
-            border-top: 1px solid #30363d;
-        }
-        """
-    )
+    app.setStyleSheet(_STYLESHEET)
 
     log.debug("Dark theme applied.")
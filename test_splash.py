@@ -3,7 +3,7 @@
 
 import sys
 from PySide6.QtWidgets import QApplication
-from PySide6.QtCore import QTimer
+from PySide6.QtCore import Qt, QTimer
 from stride_studio.gui.splash_screen import StrideStudioSplash
 
 
@@ -12,8 +12,13 @@ def main():
     splash = StrideStudioSplash(app)
     splash.show()
 
-    # Simulate loading time (3 seconds)
-    QTimer.singleShot(3000, app.quit)
+    # Simulate loading time (3 seconds) – on a precise timer, so the
+    # quit isn't a coarse tick late
+    quit_timer = QTimer()
+    quit_timer.setTimerType(Qt.PreciseTimer)
+    quit_timer.setSingleShot(True)
+    quit_timer.timeout.connect(app.quit)
+    quit_timer.start(3000)
 
     sys.exit(app.exec())
 
@@ -2,15 +2,13 @@
 # Test script for the splash screen with direct imports
 
 import sys
-import os
-
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from PySide6.QtWidgets import QApplication
-from PySide6.QtCore import QTimer
+from PySide6.QtCore import Qt, QTimer
 
-# Direct import from the local file
-from gui.splash_screen import StrideStudioSplash
+# the script's own directory is already on sys.path, so this resolves to
+# the checkout next to it rather than a shadowing top-level ``gui`` package
+from stride_studio.gui.splash_screen import StrideStudioSplash
 
 
 def main():
@@ -19,7 +17,11 @@ def main():
     splash.show()
 
     # Simulate loading time (5 seconds)
-    QTimer.singleShot(5000, app.quit)
+    quit_timer = QTimer()
+    quit_timer.setTimerType(Qt.PreciseTimer)
+    quit_timer.setSingleShot(True)
+    quit_timer.timeout.connect(app.quit)
+    quit_timer.start(5000)
 
     sys.exit(app.exec())
 